@@ -7,6 +7,13 @@ from PySide6.QtCore import QObject, Signal
 from EasiAuto.core.automator import BaseAutomator, CVAutomator, FixedAutomator, InjectAutomator, UIAAutomator
 from EasiAuto.models.config import LoginMethod, config
 
+STRATEGIES: dict[LoginMethod, type[BaseAutomator]] = {
+    LoginMethod.FIXED: FixedAutomator,
+    LoginMethod.CV: CVAutomator,
+    LoginMethod.UIA: UIAAutomator,
+    LoginMethod.INJECT: InjectAutomator,
+}
+
 
 class AutomationManager(QObject):
     started = Signal()
@@ -24,13 +31,7 @@ class AutomationManager(QObject):
         self._automator: BaseAutomator | None = None
 
     def _get_strategy_class(self, strategy: LoginMethod) -> type[BaseAutomator]:
-        strategies: dict[LoginMethod, type[BaseAutomator]] = {
-            LoginMethod.FIXED: FixedAutomator,
-            LoginMethod.CV: CVAutomator,
-            LoginMethod.UIA: UIAAutomator,
-            LoginMethod.INJECT: InjectAutomator,
-        }
-        return strategies.get(strategy, FixedAutomator)
+        return STRATEGIES.get(strategy, FixedAutomator)
 
     def run(self, type: str, credentials: Any):
         if self._automator and self._automator.isRunning():
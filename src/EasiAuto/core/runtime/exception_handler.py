@@ -2,9 +2,11 @@ import atexit
 import datetime as dt
 import platform
 import sys
+import time
 import traceback
 import uuid
 import winsound
+from functools import cache
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlencode
@@ -32,34 +34,73 @@ from qfluentwidgets import (
 
 from EasiAuto import __version__
 from EasiAuto.consts import IS_DEV, LOG_DIR
-from EasiAuto.core.utils import get_resource, restart, stop
+from EasiAuto.core.utils import app_icon_image, restart, stop
 from EasiAuto.models.config import config
 
 SENTRY_DSN = "https://992aafe788df5155ed58c1498188ae6b@o4510727360348160.ingest.us.sentry.io/4510727362248704"
 SENTRY_ATTACH_DEBUG_CONTEXT = True
 
 ERROR_DEBOUNCE = dt.timedelta(seconds=2)
+SENTRY_RATE_LIMIT = dt.timedelta(seconds=10)  # 同一来源的同类异常在此时间内只上报一次
+ERROR_DETAILS_TB_LIMIT = 20  # 错误对话框中展示的最大堆栈帧数（保留最内层），完整堆栈见日志
 last_error_time = dt.datetime.now() - ERROR_DEBOUNCE
 error_dialog_showing = False
-ignore_errors: list[str] = []
+ignore_errors: set[str] = set()
 _last_sentry_event_id: str | None = None
+_sentry_last_sent: dict[tuple[str, str], dt.datetime] = {}  # (来源, 异常类型) -> 上次上报时间
+
+PROCESS_STATS_TTL = 1.0  # 秒
 
 
 class StreamToLogger:
     """重定向 print() 到 loguru"""
 
+    def __init__(self) -> None:
+        self._log = logger.opt(depth=1).info
+
     def write(self, message: str) -> None:
-        msg = message.strip()
-        if msg:
-            logger.opt(depth=1).info(msg)
+        # print() 会单独写入换行符，先判断空白以免为其构造新字符串
+        if not message or message.isspace():
+            return
+        self._log(message.strip())
 
     def flush(self) -> None:
         pass
 
 
+@cache
+def _current_process() -> psutil.Process:
+    """获取当前进程对象（复用同一实例，避免每次异常都重新打开进程）"""
+    return psutil.Process()
+
+
+class _ProcessStatsCache:
+    """当前进程的内存占用 (MB) 与线程数采样，在 PROCESS_STATS_TTL 内复用上次结果"""
+
+    def __init__(self) -> None:
+        self._sampled_at: float | None = None
+        self._stats: tuple[float, int] = (0.0, 0)
+
+    def get(self) -> tuple[float, int]:
+        now = time.monotonic()
+        if self._sampled_at is None or now - self._sampled_at >= PROCESS_STATS_TTL:
+            process = _current_process()
+            with process.oneshot():
+                self._stats = (process.memory_info().rss / 1024 / 1024, process.num_threads())
+            self._sampled_at = now
+        return self._stats
+
+
+_process_stats_cache = _ProcessStatsCache()
+
+
+def _process_stats() -> tuple[float, int]:
+    """获取当前进程的内存占用 (MB) 与线程数（短时间内连续出错时复用上次采样）"""
+    return _process_stats_cache.get()
+
+
 def _build_debug_context(source: str, handled: bool) -> dict[str, Any]:
-    process = psutil.Process()
-    memory_info = process.memory_info()
+    memory_mb, thread_count = _process_stats()
     return {
         "source": source,
         "handled": handled,
@@ -67,8 +108,8 @@ def _build_debug_context(source: str, handled: bool) -> dict[str, Any]:
         "python": sys.version.split()[0],
         "platform": platform.platform(),
         "argv": sys.argv,
-        "memory_usage_mb": round(memory_info.rss / 1024 / 1024, 2),
-        "thread_count": process.num_threads(),
+        "memory_usage_mb": round(memory_mb, 2),
+        "thread_count": thread_count,
         "is_dev": IS_DEV,
     }
 
@@ -88,9 +129,7 @@ def _log_exception(
     exc_type: type, exc_value: BaseException, exc_tb: Any, source: str, handled: bool
 ) -> tuple[str, str]:
     file_name, line_no, func_name = _last_tb_frame(exc_tb)
-    process = psutil.Process()
-    memory_info = process.memory_info()
-    thread_count = process.num_threads()
+    memory_mb, thread_count = _process_stats()
 
     prefix = "业务异常" if handled else "未捕获异常"
     log_msg = f"""{prefix}:
@@ -98,7 +137,7 @@ def _log_exception(
 ├─异常类型: {exc_type.__name__}
 ├─异常信息: {exc_value}
 ├─发生位置: {file_name}:{line_no} in {func_name}
-├─运行状态: 内存使用 {memory_info.rss / 1024 / 1024:.1f}MB 线程数: {thread_count}
+├─运行状态: 内存使用 {memory_mb:.1f}MB 线程数: {thread_count}
 └─详细堆栈信息:"""
     tip_msg = f"""异常类型: {exc_type.__name__}
 └─发生位置: {file_name}:{line_no} in {func_name}"""
@@ -108,17 +147,12 @@ def _log_exception(
     return log_msg, tip_msg
 
 
-def _capture_exception_to_sentry(
+def _send_to_sentry(
     exc_info: tuple[type, BaseException, Any],
     source: str,
     handled: bool,
-    extra_context: dict[str, Any] | None = None,
+    extra_context: dict[str, Any] | None,
 ) -> str | None:
-    if not sentry_sdk.get_client().is_active():
-        return None
-
-    global _last_sentry_event_id
-
     if SENTRY_ATTACH_DEBUG_CONTEXT:
         debug_context = _build_debug_context(source, handled)
     else:
@@ -130,10 +164,32 @@ def _capture_exception_to_sentry(
         scope.set_context("runtime", debug_context)
         if extra_context:
             scope.set_context("extra_context", extra_context)
-        event_id = sentry_sdk.capture_exception(exc_info)
-        if event_id:
-            _last_sentry_event_id = event_id
-        return event_id
+        return sentry_sdk.capture_exception(exc_info)
+
+
+def _capture_exception_to_sentry(
+    exc_info: tuple[type, BaseException, Any],
+    source: str,
+    handled: bool,
+    extra_context: dict[str, Any] | None = None,
+) -> str | None:
+    global _last_sentry_event_id
+
+    if not sentry_sdk.get_client().is_active():
+        return None
+
+    # 短时间内重复出现的同类异常不再重复采集上下文与上报
+    key = (source, exc_info[0].__name__)
+    now = dt.datetime.now()
+    if (last_sent := _sentry_last_sent.get(key)) and now - last_sent <= SENTRY_RATE_LIMIT:
+        # 同来源的不同异常也会被合并，不能沿用之前的事件 ID，报告中不附带事件 ID
+        event_id = None
+    else:
+        _sentry_last_sent[key] = now
+        event_id = _send_to_sentry(exc_info, source, handled, extra_context)
+
+    _last_sentry_event_id = event_id
+    return event_id
 
 
 def capture_handled_exception(
@@ -155,7 +211,8 @@ def qt_message_handler(mode: QtMsgType, context: Any, message: str) -> None:
         return
     if mode in (QtMsgType.QtFatalMsg, QtMsgType.QtCriticalMsg):
         logger.critical(msg)
-    logger.complete()
+    if mode == QtMsgType.QtFatalMsg:
+        logger.complete()  # 进程即将终止，等待日志写入完成
 
 
 class ErrorDialog(Dialog):
@@ -180,7 +237,7 @@ class ErrorDialog(Dialog):
 
         self.iconLabel = ImageLabel()
         try:
-            self.iconLabel.setImage(get_resource("icons/EasiAuto.ico"))
+            self.iconLabel.setImage(app_icon_image(50))
         except Exception:
             logger.warning("未能加载崩溃报告图标")
         self.error_log = PlainTextEdit()
@@ -206,7 +263,6 @@ class ErrorDialog(Dialog):
         self.cancelButton.hide()
         self.title_layout.setSpacing(12)
         self.resize(650, 450)
-        QApplication.processEvents()
 
         self.report_problem.clicked.connect(self.report_problem_to_github)
         self.copy_log_btn.clicked.connect(self.copy_log)
@@ -249,7 +305,7 @@ class ErrorDialog(Dialog):
 
     def ignore_error(self) -> None:
         if self.ignore_same_error.isChecked():
-            ignore_errors.append("\n".join(self.error_log.toPlainText().splitlines()[2:]) + "\n")
+            ignore_errors.add("\n".join(self.error_log.toPlainText().splitlines()[2:]) + "\n")
         self.close()
         global error_dialog_showing
         error_dialog_showing = False
@@ -271,17 +327,24 @@ class ErrorDialog(Dialog):
 def handle_unhandled_exception(exc_type: type, exc_value: BaseException, exc_tb: Any, source: str) -> None:
     global last_error_time
 
-    error_details = "".join(traceback.format_exception(exc_type, exc_value, exc_tb))
-    if error_details in ignore_errors:
-        return
-
-    now = dt.datetime.now()
-    if now - last_error_time <= ERROR_DEBOUNCE:
-        return
-    last_error_time = now
+    try:
+        # 先判断是否处于防抖期，防抖期内无需格式化堆栈
+        now = dt.datetime.now()
+        if now - last_error_time <= ERROR_DEBOUNCE:
+            return
 
-    _, tip_msg = _log_exception(exc_type, exc_value, exc_tb, source=source, handled=False)
-    _capture_exception_to_sentry((exc_type, exc_value, exc_tb), source=source, handled=False)
+        error_details = "".join(
+            traceback.TracebackException(exc_type, exc_value, exc_tb, limit=-ERROR_DETAILS_TB_LIMIT).format()
+        )
+        if error_details in ignore_errors:
+            return
+        last_error_time = now
+
+        _, tip_msg = _log_exception(exc_type, exc_value, exc_tb, source=source, handled=False)
+        _capture_exception_to_sentry((exc_type, exc_value, exc_tb), source=source, handled=False)
+    finally:
+        # 日志与上报均已完成格式化，释放各帧的局部变量，避免反复出错时内存堆积
+        traceback.clear_frames(exc_tb)
 
     if error_dialog_showing:
         return
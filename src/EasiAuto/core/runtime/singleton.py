@@ -59,11 +59,10 @@ def _iter_other_process_windows(current_pid: int) -> list[tuple[int, int]]:
 def _is_same_app_process(pid: int) -> bool:
     """通过可执行路径和进程名判断是否为同应用"""
     try:
-        proc = psutil.Process(pid)
-        exe = proc.exe()
-        proc_name = proc.name().lower()
+        exe = psutil.Process(pid).exe()
     except Exception:
         return False
+    proc_name = Path(exe).name.lower()
 
     expected = _normalize_path(EA_EXECUTABLE)
     actual = _normalize_path(exe)
@@ -76,8 +75,12 @@ def _is_same_app_process(pid: int) -> bool:
 
 def _focus_existing_instance(current_pid: int) -> bool:
     """查找并尝试激活已运行实例窗口"""
+    # 同一进程常有多个顶层窗口，按 pid 缓存判断结果，避免重复打开进程句柄
+    same_app: dict[int, bool] = {}
     for hwnd, pid in _iter_other_process_windows(current_pid):
-        if not _is_same_app_process(pid):
+        if pid not in same_app:
+            same_app[pid] = _is_same_app_process(pid)
+        if not same_app[pid]:
             continue
         title = win32gui.GetWindowText(hwnd)
         if _bring_window_to_front(hwnd):
@@ -99,7 +102,8 @@ def check_singleton(focus_existing: bool = True) -> bool:
         # 互斥锁不可用时，退化为窗口/进程扫描
         if focus_existing:
             return not _focus_existing_instance(os.getpid())
-        return not any(_is_same_app_process(pid) for _, pid in _iter_other_process_windows(os.getpid()))
+        pids = {pid for _, pid in _iter_other_process_windows(os.getpid())}
+        return not any(_is_same_app_process(pid) for pid in pids)
 
     logger.warning("检测到另一个正在运行的实例 (Mutex)")
     if focus_existing:
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import math
 import os
 import signal
 import sys
 from abc import ABCMeta
 from contextlib import suppress
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import NoReturn, cast, overload
 
@@ -18,6 +20,7 @@ import win32process
 from loguru import logger
 
 from PySide6.QtCore import QObject, Qt
+from PySide6.QtGui import QImage, QImageReader
 from PySide6.QtWidgets import QApplication, QWidget
 from qfluentwidgets import InfoBar, InfoBarPosition
 
@@ -28,11 +31,30 @@ from EasiAuto.consts import (
 )
 
 
+@cache
 def get_resource(filename: str):
     """获取资源路径"""
     return str(EA_RESDIR / filename)
 
 
+@cache
+def app_icon_image(size: int) -> QImage:
+    """读取应用图标中不小于显示尺寸的最小一帧，避免解码最大帧后再缩放"""
+    screen = QApplication.primaryScreen()
+    target = math.ceil(size * (screen.devicePixelRatio() if screen else 1))
+
+    reader = QImageReader(get_resource("icons/EasiAuto.ico"))
+    frames: list[tuple[int, int]] = []  # (宽度, 帧序号)
+    for index in range(reader.imageCount()):
+        if reader.jumpToImage(index):
+            frames.append((reader.size().width(), index))
+    if frames:
+        large_enough = [frame for frame in frames if frame[0] >= target]
+        _, index = min(large_enough) if large_enough else max(frames)
+        reader.jumpToImage(index)
+    return reader.read()
+
+
 def get_scale() -> float:
     """获取当前系统缩放比例"""
     app = cast(QApplication, QApplication.instance())
@@ -147,6 +169,18 @@ class QABCMeta(type(QObject), ABCMeta):  # type: ignore
     """QObject 与抽象基类的兼容元类"""
 
 
+@cache
+def wscript_shell():
+    """获取共享的 WScript.Shell COM 对象（仅在主线程使用）"""
+    return win32com.client.Dispatch("WScript.Shell")
+
+
+# 快捷方式中与具体档案无关的固定字段
+SHORTCUT_TARGET = str(EA_EXECUTABLE)
+SHORTCUT_WORKING_DIR = str(EA_BASEDIR)
+SHORTCUT_ICON = get_resource("icons/EasiAutoShortcut.ico")
+
+
 def create_shortcut(args: str, name: str, show_result_to: QWidget | None = None):
     """创建 EasiAuto 桌面快捷方式"""
     try:
@@ -154,7 +188,7 @@ def create_shortcut(args: str, name: str, show_result_to: QWidget | None = None)
 
         logger.info(f"在桌面创建快捷方式: {name}")
 
-        shell = win32com.client.Dispatch("WScript.Shell")
+        shell = wscript_shell()
         desktop_path = Path(shell.SpecialFolders("Desktop"))
         shortcut_path = desktop_path / name
 
@@ -164,10 +198,10 @@ def create_shortcut(args: str, name: str, show_result_to: QWidget | None = None)
             logger.debug(f"已删除现有快捷方式: {shortcut_path}")
 
         shortcut = shell.CreateShortcut(str(shortcut_path))
-        shortcut.TargetPath = str(EA_EXECUTABLE)
+        shortcut.TargetPath = SHORTCUT_TARGET
         shortcut.Arguments = args
-        shortcut.WorkingDirectory = str(EA_BASEDIR)
-        shortcut.IconLocation = get_resource("icons/EasiAutoShortcut.ico")
+        shortcut.WorkingDirectory = SHORTCUT_WORKING_DIR
+        shortcut.IconLocation = SHORTCUT_ICON
         shortcut.Save()
 
         logger.success("创建成功")
@@ -203,7 +237,7 @@ def _normalize_windows_path(path: str | Path) -> str:
 def migrate_desktop_shortcut_icon() -> int:
     """迁移桌面 EasiAuto 快捷方式图标路径到新位置。"""
     try:
-        shell = win32com.client.Dispatch("WScript.Shell")
+        shell = wscript_shell()
         desktop_path = Path(shell.SpecialFolders("Desktop"))
     except Exception as e:
         logger.warning(f"获取桌面路径失败，跳过快捷方式图标迁移: {e}")
@@ -320,11 +354,12 @@ def kill_process(name: str, force: bool = False, wait: bool = False, timeout: fl
                     process.terminate()
                 logger.info(f"已向进程 {name} 发送{'强行' if force else ''}终止信号{', 等待中……' if wait else ''}")
 
-                try:
-                    process.wait(timeout)
-                    logger.info(f"成功关闭进程 {name}")
-                except psutil.TimeoutExpired:
-                    logger.warning(f"进程 {name} 关闭超时")
+                if wait:
+                    try:
+                        process.wait(timeout)
+                        logger.info(f"成功关闭进程 {name}")
+                    except psutil.TimeoutExpired:
+                        logger.warning(f"进程 {name} 关闭超时")
             except psutil.NoSuchProcess:
                 logger.warning(f"进程 {name} 已不存在")
             except psutil.AccessDenied:
@@ -335,6 +370,25 @@ def kill_process(name: str, force: bool = False, wait: bool = False, timeout: fl
                     os.system(f'taskkill /im "{name}.exe" >nul 2>&1')
 
 
+def open_process_handle(name: str):
+    """打开指定名称进程的句柄（仅具有等待权限），进程不存在或无权访问时返回 None"""
+    for process in psutil.process_iter(["name"]):
+        if process.info["name"] == f"{name}.exe":
+            try:
+                return win32api.OpenProcess(win32con.SYNCHRONIZE, False, process.pid)
+            except pywintypes.error as e:
+                logger.debug(f"无法打开进程 {name} 的句柄: {e}")
+                return None
+    return None
+
+
+@lru_cache(maxsize=1)
+def _resolve_shortcut_target(lnk_path: str, _mtime_ns: int) -> Path:
+    """经由 COM 解析快捷方式目标（修改时间仅作为缓存键，快捷方式未变化时不再重复解析）"""
+    shortcut = wscript_shell().CreateShortcut(lnk_path)
+    return Path(shortcut.TargetPath).resolve()
+
+
 def get_ci_executable() -> Path | None:
     """获取 ClassIsland 可执行文件位置"""
     try:
@@ -347,23 +401,21 @@ def get_ci_executable() -> Path | None:
         if not lnk_path.exists():
             return None
 
-        # 解析快捷方式
-        shell = win32com.client.Dispatch("WScript.Shell")
-        shortcut = shell.CreateShortcut(str(lnk_path))
-        target = shortcut.TargetPath
-
-        return Path(target).resolve()
+        return _resolve_shortcut_target(str(lnk_path), lnk_path.stat().st_mtime_ns)
 
     except Exception as e:
         logger.error(f"获取 ClassIsland 路径时出错: {e}")
         return None
 
 
+_SIG_NAMES: dict[int, str] = {int(s): s.name for s in signal.Signals}
+
+
 def init_exit_signal_handlers() -> None:
     """退出信号处理器"""
 
     def signal_handler(signum, _):
-        logger.debug(f"收到信号 {signal.Signals(signum).name}，退出...")
+        logger.debug(f"收到信号 {_SIG_NAMES.get(signum, signum)}，退出...")
         stop()
 
     signal.signal(signal.SIGTERM, signal_handler)  # taskkill
@@ -381,8 +433,13 @@ def _reset_signal_handlers() -> None:
 
 def restart() -> None:
     """重启程序"""
+    from EasiAuto.models.config import flush_config
+
     logger.debug("重启程序")
 
+    # os.execl 替换进程时不会执行 atexit，需先写入尚未保存的配置
+    flush_config()
+
     app = QApplication.instance()
     if app:
         _reset_signal_handlers()
@@ -15,7 +15,7 @@ from pydantic import AliasPath, BaseModel, ConfigDict, Field
 from PySide6.QtCore import QObject, Signal
 
 from EasiAuto.consts import EA_EXECUTABLE, EA_PREFIX
-from EasiAuto.core.utils import kill_process
+from EasiAuto.core.utils import kill_process, open_process_handle
 from EasiAuto.models.profile import EasiAutomation, profile
 
 
@@ -164,6 +164,7 @@ class ClassIslandManager:
         self.ci_settings: dict = {}
         self.ci_profile: dict = {}
         self.ci_automations_raw: list[dict] = []
+        self._files_stamp: tuple[tuple[int, int], ...] | None = None  # 已读取配置文件的 (修改时间, 大小)
 
         self.unmanaged_automations: list[dict] = []
         self.managed_automations: list[ManagedCiAutomation] = []
@@ -202,20 +203,39 @@ class ClassIslandManager:
     def _signature(raw: list[dict]) -> str:
         return json.dumps(raw, ensure_ascii=False, sort_keys=True)
 
+    def _stat_files(self) -> tuple[tuple[int, int], ...] | None:
+        """获取各配置文件的 (修改时间, 大小)，任一文件无法访问时返回 None"""
+        try:
+            stats = [
+                path.stat() for path in (self.settings_path, self.current_profile_path, self.current_automation_path)
+            ]
+        except OSError:
+            return None
+        return tuple((stat.st_mtime_ns, stat.st_size) for stat in stats)
+
     def reload(self, notify_on_change: bool = True):
         """重新加载所有配置"""
         try:
-            previous_signature = self._signature(self.ci_automations_raw)
-            self.ci_settings = json.loads(self.settings_path.read_text(encoding="utf-8"))
-            self.ci_profile = json.loads(self.current_profile_path.read_text(encoding="utf-8"))
-            self.ci_automations_raw = json.loads(self.current_automation_path.read_text(encoding="utf-8"))
+            # 配置文件均未变化时沿用已读取的内容，仅重新区分受管理的自动化（依赖档案状态）
+            raw_changed = False
+            if (stamp := self._stat_files()) is None or stamp != self._files_stamp:
+                previous_signature = self._signature(self.ci_automations_raw)
+                previous_paths = (self.current_profile_path, self.current_automation_path)
+                self.ci_settings = json.loads(self.settings_path.read_text(encoding="utf-8"))
+                # 文件状态均取自读取之前，读取期间发生的写入会在下次加载时被发现；
+                # 所选档案随设置改变时，在读取新文件前补充记录其状态
+                if (self.current_profile_path, self.current_automation_path) != previous_paths:
+                    new_stamp = self._stat_files()
+                    stamp = None if stamp is None or new_stamp is None else (stamp[0], *new_stamp[1:])
+                self.ci_profile = json.loads(self.current_profile_path.read_text(encoding="utf-8"))
+                self.ci_automations_raw = json.loads(self.current_automation_path.read_text(encoding="utf-8"))
+                self._files_stamp = stamp
+                raw_changed = previous_signature != self._signature(self.ci_automations_raw)
 
             self._resolve_automations()
 
-            if notify_on_change:
-                current_signature = self._signature(self.ci_automations_raw)
-                if previous_signature != current_signature:
-                    self.notifier.changed.emit()
+            if notify_on_change and raw_changed:
+                self.notifier.changed.emit()
         except Exception as e:
             raise RuntimeError("加载 ClassIsland 配置时出错") from e
 
@@ -348,8 +368,16 @@ class ClassIslandManager:
     def start_ci(self):
         subprocess.Popen(self.exe_path, cwd=self.exe_path.parent)
 
+    @property
+    def process_name(self) -> str:
+        return "ClassIsland.Desktop" if self.is_v2 else "ClassIsland"
+
     def stop_ci(self, force: bool = False, wait: bool = False, timeout: int = 2):
-        kill_process("ClassIsland.Desktop" if self.is_v2 else "ClassIsland", force=force, wait=wait, timeout=timeout)
+        kill_process(self.process_name, force=force, wait=wait, timeout=timeout)
+
+    def open_process_handle(self):
+        """打开 ClassIsland 进程句柄，用于等待其退出"""
+        return open_process_handle(self.process_name)
 
 
 class _ClassIslandManagerProxy:
@@ -32,7 +32,7 @@ from EasiAuto.core.utils import (
     migrate_desktop_shortcut_icon,
     stop,
 )
-from EasiAuto.models.config import UpdateMode, config
+from EasiAuto.models.config import UpdateMode, config, flush_config
 from EasiAuto.models.profile import BaseAutomation, EasiAutomation, QrCodeAutomation, profile
 from EasiAuto.services.announcement_service import announcement_service
 from EasiAuto.services.toast_service import ToastNotifier
@@ -51,15 +51,6 @@ from EasiAuto.view.main_window import MainWindow
 UI_COMMANDS = {None, "settings"}
 FORWARDABLE_COMMANDS = {"login", "skip"}
 
-init_exception_handler()
-init_exit_signal_handlers()
-
-app = QApplication(sys.argv)
-translator = FluentTranslator()
-app.installTranslator(translator)
-setTheme(Theme(config.App.Theme.value))
-setThemeColor("#00C884")
-
 
 def shutdown():
     for action in (
@@ -71,12 +62,24 @@ def shutdown():
             config.Statistics.TotalRunTime
             + (datetime.now(UTC) - config.Statistics.ThisInstanceLaunchTime).total_seconds(),
         ),
+        flush_config,
     ):
         with suppress(Exception):
             action()
 
 
-atexit.register(shutdown)
+def _bootstrap_app() -> QApplication:
+    """初始化运行环境并创建 QApplication（仅在启动时调用，导入本模块不产生副作用）"""
+    init_exception_handler()
+    init_exit_signal_handlers()
+
+    app = QApplication(sys.argv)
+    app.installTranslator(FluentTranslator(parent=app))
+    setTheme(Theme(config.App.Theme.value))
+    setThemeColor("#00C884")
+
+    atexit.register(shutdown)
+    return app
 
 
 class PostLoginUpdateThread(QThread):
@@ -99,7 +102,8 @@ class PostLoginUpdateThread(QThread):
 
 
 class Launcher:
-    def __init__(self) -> None:
+    def __init__(self, app: QApplication) -> None:
+        self.app = app
         self.main_window: MainWindow | None = None
         self.banner: WarningBanner | None = None
         self.status_overlay: StatusOverlayBase | None = None
@@ -113,6 +117,12 @@ class Launcher:
         self._ipc_context: bool = False
         self._current_login_triggered_via_ipc: bool = False
         self._post_login_update_thread: PostLoginUpdateThread | None = None
+        # 登录结束后延迟关闭状态浮窗；新的登录开始时需停止，避免误关新浮窗
+        self._overlay_close_from_ipc: bool = False
+        self._overlay_close_timer = QTimer()
+        self._overlay_close_timer.setSingleShot(True)
+        self._overlay_close_timer.setInterval(3000)
+        self._overlay_close_timer.timeout.connect(lambda: self._close_status_overlay(self._overlay_close_from_ipc))
         automation_manager.finished.connect(self._on_login_finished)
         automation_manager.failed.connect(self._on_login_failed)
         automation_manager.privacy_mask_show.connect(self._on_privacy_mask_show)
@@ -122,11 +132,16 @@ class Launcher:
         if self.main_window is None:
             self.main_window = MainWindow()
             self.main_window.runAutomation.connect(self._handle_login_request_from_ui)
+            # 关闭后窗口会被延迟删除，关闭时即释放引用，避免期间的请求操作将被删除的窗口
+            self.main_window.closed.connect(self._on_main_window_closed)
         self.main_window.setWindowState(self.main_window.windowState() & ~Qt.WindowState.WindowMinimized)
         self.main_window.show()
         self.main_window.raise_()
         self.main_window.activateWindow()
 
+    def _on_main_window_closed(self) -> None:
+        self.main_window = None
+
     def _handle_login_request_from_ui(self, automation: BaseAutomation) -> None:
         """响应从 UI 发送的自动登录执行请求"""
         if self.main_window:
@@ -187,7 +202,8 @@ class Launcher:
         )
 
         if self.status_overlay is not None:
-            QTimer.singleShot(3000, lambda: self._close_status_overlay(from_ipc))
+            self._overlay_close_from_ipc = from_ipc
+            self._overlay_close_timer.start()
 
         if should_check_update:
             self._post_login_update_thread = PostLoginUpdateThread()
@@ -372,6 +388,9 @@ class Launcher:
                     logger.warning(f"计算状态浮窗位置时出错: {e}")
                     available_space = 0
 
+                # 上一次登录的浮窗可能仍在等待关闭，先停止关闭计时器并释放，以免其槽函数随全局信号重复触发
+                self._overlay_close_timer.stop()
+                self.status_overlay = self._safe_cleanup_widget(self.status_overlay)
                 self.status_overlay = StatusOverlay() if available_space > 300 else SmallStatusOverlay()
                 self.status_overlay.stop_clicked.connect(self._on_stop_automation)
                 automation_manager.started.connect(self.status_overlay.show)
@@ -398,14 +417,18 @@ class Launcher:
             return False
 
         if not self._ipc_context:
-            stop(app.exec())
+            stop(self.app.exec())
         return True
 
     def cmd_settings(self, _) -> None:
         """settings 子命令 - 打开设置界面"""
-        self._show_settings_window()
-        if not self._ipc_context:
-            stop(app.exec())
+        if self._ipc_context:
+            self._show_settings_window()
+            return
+
+        # 先进入事件循环再构建窗口，启动阶段排队的事件无需等待整个窗口构建完成
+        QTimer.singleShot(0, self._show_settings_window)
+        stop(self.app.exec())
 
     def cmd_skip(self, _) -> None:
         """skip 子命令 - 跳过下一次登录"""
@@ -508,4 +531,5 @@ class Launcher:
 
 
 def main() -> None:
-    Launcher().run()
+    app = _bootstrap_app()
+    Launcher(app).run()
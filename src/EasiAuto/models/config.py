@@ -19,7 +19,9 @@ from loguru import logger
 from packaging.version import Version
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field
 from pydantic.fields import FieldInfo
+from pydantic_core import from_json
 
+from PySide6.QtCore import QCoreApplication, QThread, QTimer
 from PySide6.QtGui import QColor
 
 from EasiAuto import __version__
@@ -87,6 +89,42 @@ class DownloadSource(InformativeEnum):
     GHFAST = ("ghfast", "ghfast")
 
 
+# 配置修改后延迟保存的时长（毫秒）
+SAVE_DELAY_MS = 300
+
+
+class _DeferredSaver:
+    """延迟保存全局配置，合并短时间内的连续修改"""
+
+    def __init__(self) -> None:
+        self._timer: QTimer | None = None
+
+    def schedule(self) -> None:
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.setInterval(SAVE_DELAY_MS)
+            self._timer.timeout.connect(self._save)
+        self._timer.start()
+
+    def flush(self) -> None:
+        if self._timer is not None and self._timer.isActive():
+            self._timer.stop()
+            self._save()
+
+    @staticmethod
+    def _save() -> None:
+        config.save()
+
+
+_deferred_saver = _DeferredSaver()
+
+
+def flush_config() -> None:
+    """立即写入全局配置尚未保存的修改"""
+    _deferred_saver.flush()
+
+
 class ConfigModel(BaseModel):
     """带自动保存能力的配置模型"""
 
@@ -127,10 +165,19 @@ class ConfigModel(BaseModel):
         except Exception as e:
             logger.error(f"保存配置失败: {e}")
 
+    def schedule_save(self) -> None:
+        """延迟保存配置，合并短时间内的连续修改（无事件循环或非全局配置时立即保存）"""
+        app = QCoreApplication.instance()
+        if app is None or QThread.currentThread() != app.thread() or self._root() is not config:
+            self.save()
+            return
+
+        _deferred_saver.schedule()
+
     def __setattr__(self, name: str, value):
         super().__setattr__(name, value)
         if getattr(self, "_initialized", False) and not name.startswith("_"):
-            self.save()
+            self.schedule_save()
 
     def _bind_children(self):
         """递归绑定所有子模型的父模型"""
@@ -628,6 +675,9 @@ PAGE_INDEX: dict[str, list[str]] = {
     "UpdatePage": ["Update"],
 }
 
+# 需要执行迁移的最高配置版本，新增迁移时需同步更新
+LAST_MIGRATION_VERSION = Version("1.1.3")
+
 
 class Config(ConfigModel):
     # NOTE: 添加配置项后，需在上方 PAGE_INDEX 同步更新以生效
@@ -651,6 +701,9 @@ class Config(ConfigModel):
     Internal: InternalConfig = Field(default_factory=InternalConfig, title="内部数据")
     Statistics: StatisticsConfig = Field(default_factory=StatisticsConfig, title="统计数据")
 
+    # 各页面的配置项结构缓存（配置项绑定本实例并按路径取值，结构本身在运行期间不变）
+    _page_items: dict[str, list[ConfigItem | ConfigGroup]] = PrivateAttr(default_factory=dict)
+
     @staticmethod
     def migrate_config(obj: Any):
         """对旧配置进行额外的迁移"""
@@ -668,11 +721,15 @@ class Config(ConfigModel):
         except Exception:
             return obj
 
+        # 无需迁移时直接返回，避免每次启动都深拷贝整份配置
+        if last_version > LAST_MIGRATION_VERSION:
+            return obj
+
         backup_obj = deepcopy(obj)
 
         try:
             transferred = False
-            if last_version <= Version("1.1.3"):  # noqa: SIM102
+            if last_version <= LAST_MIGRATION_VERSION:  # noqa: SIM102
                 transferred = True
                 if obj["Login"]["Directly"]:
                     del obj["Login"]["Directly"]
@@ -696,7 +753,7 @@ class Config(ConfigModel):
             return config
 
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = from_json(path.read_bytes())
             migrated = cls.migrate_config(data)
             cfg = cls(**migrated)
         except Exception as e:
@@ -758,7 +815,9 @@ class Config(ConfigModel):
         return True
 
     def load_page(self, page: str) -> list[ConfigItem | ConfigGroup]:
-        return self.iter_items(only=PAGE_INDEX[page])
+        if (items := self._page_items.get(page)) is None:
+            items = self._page_items[page] = self.iter_items(only=PAGE_INDEX[page])
+        return items
 
 
 @dataclass
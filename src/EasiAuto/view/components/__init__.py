@@ -1,4 +1,5 @@
 from .announcement_card import AnnouncementCard
+from .lazy_page import LazyPage
 from .pre_run_popup import DialogResponse, PreRunPopup
 from .privacy_mask import PrivacyMask
 from .setting_card import ExpandSelectorSettingCard, SettingCard
@@ -8,6 +9,7 @@ from .warning_banner import WarningBanner
 __all__ = [
     "AnnouncementCard",
     "DialogResponse",
+    "LazyPage",
     "PreRunPopup",
     "PrivacyMask",
     "ExpandSelectorSettingCard",
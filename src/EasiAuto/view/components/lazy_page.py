@@ -0,0 +1,39 @@
+from collections.abc import Callable
+
+from loguru import logger
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QVBoxLayout, QWidget
+
+
+class LazyPage(QWidget):
+    """延迟构建的页面容器，首次显示时才创建实际页面"""
+
+    def __init__(self, object_name: str, factory: Callable[[], QWidget], parent=None):
+        super().__init__(parent)
+        self.setObjectName(object_name)
+
+        self._factory = factory
+        self._page: QWidget | None = None
+
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.setSpacing(0)
+
+    @property
+    def page(self) -> QWidget:
+        """获取实际页面（尚未创建时立即创建）"""
+        if self._page is None:
+            logger.debug(f"延迟构建页面: {self.objectName()}")
+            self._page = self._factory()
+            self._layout.addWidget(self._page)
+        return self._page
+
+    def _ensure_page(self):
+        _ = self.page
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # 推迟到下一轮事件循环构建，先让页面切换及时响应
+        if self._page is None:
+            QTimer.singleShot(0, self._ensure_page)
@@ -2,7 +2,6 @@ from enum import Enum
 from typing import Any
 
 from PySide6.QtCore import QPoint, Qt, QTimer, Signal
-from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QHBoxLayout,
 )
@@ -14,7 +13,8 @@ from qfluentwidgets import (
     PushButton,
 )
 
-from EasiAuto.core.utils import get_resource
+from EasiAuto.core.utils import app_icon_image
+from EasiAuto.view.helpers import app_icon
 
 
 class DialogResponse(Enum):
@@ -31,7 +31,7 @@ class PreRunPopup(Dialog):
 
     def __init__(self):
         super().__init__(title="EasiAuto", content="将在 N/A 秒后继续执行")
-        self.setWindowIcon(QIcon(get_resource("icons/EasiAuto.ico")))
+        self.setWindowIcon(app_icon())
 
         self.account_name: str | None = None
         self.response: DialogResponse | None = None
@@ -42,7 +42,7 @@ class PreRunPopup(Dialog):
 
         # 文本
         self.iconLabel = ImageLabel()
-        self.iconLabel.setImage(get_resource("icons/EasiAuto.ico"))
+        self.iconLabel.setImage(app_icon_image(50))
         self.iconLabel.setScaledContents(True)
         self.iconLabel.setFixedSize(50, 50)
 
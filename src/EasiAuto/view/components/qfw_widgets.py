@@ -396,9 +396,15 @@ class SettingCardGroup(QWidget):
         self.adjustSize()
 
     def addSettingCards(self, cards: list[QWidget]):
-        """add setting cards to group"""
-        for card in cards:
-            self.addSettingCard(card)
+        """add setting cards to group (only adjust size once)"""
+        self.setUpdatesEnabled(False)
+        try:
+            for card in cards:
+                card.setParent(self)
+                self.cardLayout.addWidget(card)
+        finally:
+            self.setUpdatesEnabled(True)
+        self.adjustSize()
 
     def adjustSize(self):
         h = self.cardLayout.heightForWidth(self.width()) + 46
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import weakref
 from enum import Enum, auto
+from functools import cache
 from typing import Any, assert_never, cast
 
 import qt_pydantic as qtp
@@ -39,6 +40,16 @@ from qfluentwidgets import (
 from EasiAuto.models.config import ConfigGroup, ConfigItem
 from EasiAuto.view.components.qfw_widgets import CustomRadioButton, SettingIconWidget
 
+# 图标名 -> FluentIcon，避免每张卡片都经过枚举的值查找
+FLUENT_ICONS: dict[str, FluentIcon] = {icon.value: icon for icon in FluentIcon}
+
+
+@cache
+def enum_options(enum_type: type[Enum]) -> tuple[tuple[Enum, ...], tuple[str, ...]]:
+    """获取枚举的选项及其显示名称（按类型缓存）"""
+    options = tuple(enum_type)
+    return options, tuple(getattr(option, "display_name", option.name) for option in options)
+
 
 class CardType(Enum):
     """设置卡片类型"""
@@ -313,22 +324,14 @@ class SettingCard(QFrame):
 
         if self.config_item and issubclass(self.config_item.type_, Enum):
             # 加载枚举项
-            options = list(self.config_item.type_)
-            self.options_index = []
-            for option in options:
-                name = getattr(option, "display_name", option.name)
-                self.options_index.append(option)
+            self.options_index, texts = enum_options(self.config_item.type_)
+            for option, name in zip(self.options_index, texts, strict=True):
                 self._widget.addItem(name, userData=option)
 
             # 设置当前值
             current_value: Enum = self.config_item.value
-            current_index = -1
-            for i, opt in enumerate(options):
-                if opt == current_value:
-                    current_index = i
-                    break
-            if current_index >= 0:
-                self._widget.setCurrentIndex(current_index)
+            if current_value in self.options_index:
+                self._widget.setCurrentIndex(self.options_index.index(current_value))
 
         self._widget.currentIndexChanged.connect(lambda i: self._on_value_changed(self.options_index[i]))
 
@@ -473,13 +476,11 @@ class SettingCard(QFrame):
         # 获取附加信息
         extra = config_item.json_schema_extra or {}
 
-        icon: FluentIcon | QIcon | None = None
+        icon: FluentIcon | None = None
         if icon_name := extra.get("icon"):
-            try:
-                icon = FluentIcon(icon_name)
-            except ValueError:
+            icon = FLUENT_ICONS.get(icon_name)
+            if icon is None:
                 logger.warning(f"无法加载图标: {icon_name}")
-                icon = None
 
         kwargs: dict[str, Any] = {}
         supported_args = []  # 暂时弃用，已被动态注入（应该算吧？）取代
@@ -558,9 +559,11 @@ class SettingCard(QFrame):
         )
 
     @classmethod
-    def update_all(cls):
-        """更新所有配置卡的值"""
-        for card in cls.index.values():
+    def update_all(cls, path: str | None = None):
+        """更新所有配置卡的值，指定 path 时仅更新该路径下的配置卡"""
+        for name, card in list(cls.index.items()):
+            if path and name != path and not name.startswith(f"{path}."):
+                continue
             if isinstance(card, ExpandGroupSettingCard) and not isinstance(card, ExpandSelectorSettingCard):
                 continue
             card._initialized = False
@@ -17,7 +17,7 @@ from PySide6.QtWidgets import (
 )
 from qfluentwidgets import FluentIcon, IconWidget, ImageLabel, IndeterminateProgressRing, PrimaryPushButton
 
-from EasiAuto.core.utils import QABCMeta, get_resource, get_scale, get_screen_size
+from EasiAuto.core.utils import QABCMeta, app_icon_image, get_scale, get_screen_size
 
 
 class StatusOverlayBase(QWidget, metaclass=QABCMeta):
@@ -203,7 +203,7 @@ class StatusOverlay(StatusOverlayBase):
         bottom_layout.setSpacing(8)
 
         self.logo = ImageLabel(self.bottom)
-        self.logo.setImage(get_resource("icons/EasiAuto.ico"))
+        self.logo.setImage(app_icon_image(32))
         self.logo.setFixedSize(32, 32)
         self.logo.setScaledContents(True)
 
@@ -1,8 +1,19 @@
 from enum import Enum
-from typing import TYPE_CHECKING, cast
-
-from PySide6.QtWidgets import QApplication, QWidget
-from qfluentwidgets import ExpandGroupSettingCard, FluentIconBase, SwitchButton, ToolTipFilter
+from functools import cache
+from typing import TYPE_CHECKING, Literal, cast
+
+from PySide6.QtCore import QObject, Qt, Slot
+from PySide6.QtGui import QIcon, QInputDevice
+from PySide6.QtWidgets import QAbstractScrollArea, QApplication, QScroller, QWidget
+from qfluentwidgets import (
+    ExpandGroupSettingCard,
+    FluentIconBase,
+    InfoBar,
+    InfoBarPosition,
+    SwitchButton,
+    ToolTipFilter,
+    isDarkTheme,
+)
 from qfluentwidgets.common.config import Theme
 
 from EasiAuto.core.utils import get_resource
@@ -20,19 +31,74 @@ class Icons(FluentIconBase, Enum):
         return get_resource(f"icons/{self.value}")
 
 
+@cache
+def shared_icon(icon: FluentIconBase) -> QIcon:
+    """获取共享的 QIcon 实例（图标引擎在绘制时跟随主题，可安全复用）"""
+    return icon.qicon()
+
+
+def cached_icon(icon: FluentIconBase, size: int) -> QIcon:
+    """获取预渲染为位图的图标（按主题缓存），避免大尺寸图标每次绘制时重新渲染 SVG"""
+    return _render_icon(icon, size, isDarkTheme())
+
+
+@cache
+def _render_icon(icon: FluentIconBase, size: int, _is_dark: bool) -> QIcon:
+    return QIcon(icon.icon().pixmap(size, size))
+
+
+@cache
+def app_icon() -> QIcon:
+    """获取共享的应用图标，避免每次创建窗口都重新读取 .ico 文件"""
+    return QIcon(get_resource("icons/EasiAuto.ico"))
+
+
+class _EnableBinder(QObject):
+    """按开关状态启用/禁用组件，每个开关仅连接一次信号"""
+
+    def __init__(self, switch: SwitchButton):
+        super().__init__(switch)
+        self.targets: list[tuple[QWidget, bool, bool]] = []  # (组件, 是否反转, 禁用时是否收起)
+        switch.checkedChanged.connect(self.on_checked_changed)
+
+    @Slot(bool)
+    def on_checked_changed(self, checked: bool):
+        self.apply(self.targets, checked)
+
+    @staticmethod
+    def apply(targets: list[tuple[QWidget, bool, bool]], checked: bool):
+        for widget, reverse, collapsible in targets:
+            is_enabled = checked != reverse
+            widget.setEnabled(is_enabled)
+            if collapsible and not is_enabled:
+                widget.setExpand(False)  # type: ignore[attr-defined]
+
+
 def set_enable_by(widgets: list[QWidget] | QWidget, switch: SwitchButton, reverse: bool = False):
     """通过开关启用组件"""
     widgets = [widgets] if isinstance(widgets, QWidget) else widgets
 
-    def handle_check_change(checked: bool):
-        for widget in widgets:
-            is_enabled = checked if not reverse else not checked
-            widget.setEnabled(is_enabled)
-            if not is_enabled and isinstance(widget, ExpandGroupSettingCard):
-                widget.setExpand(False)
+    binder: _EnableBinder | None = getattr(switch, "_enable_binder", None)
+    if binder is None:
+        binder = _EnableBinder(switch)
+        switch._enable_binder = binder  # type: ignore[attr-defined]
+
+    # 绑定时即确定组件类型，切换开关时无需再做类型检查
+    targets = [(widget, reverse, isinstance(widget, ExpandGroupSettingCard)) for widget in widgets]
+    binder.targets.extend(targets)
+    binder.apply(targets, switch.isChecked())
 
-    handle_check_change(switch.isChecked())
-    switch.checkedChanged.connect(handle_check_change)
+
+@cache
+def has_touch_screen() -> bool:
+    """检测是否存在触摸屏设备"""
+    return any(device.type() == QInputDevice.DeviceType.TouchScreen for device in QInputDevice.devices())
+
+
+def enable_drag_scroll(area: QAbstractScrollArea):
+    """为滚动区域启用拖动滚动（仅在存在触摸屏时注册手势）"""
+    if has_touch_screen():
+        QScroller.grabGesture(area.viewport(), QScroller.ScrollerGestureType.LeftMouseButtonGesture)
 
 
 def set_tooltip(widget: QWidget, tooltip: str):
@@ -60,6 +126,25 @@ def get_main_container() -> QWidget:
     return main_window.stackedWidget
 
 
+def show_info_bar(
+    level: Literal["info", "success", "warning", "error"],
+    title: str,
+    content: str,
+    duration: int = 3000,
+    parent: QWidget | None = None,
+):
+    """在主窗口顶部弹出消息条（默认显示于主窗口容器）"""
+    getattr(InfoBar, level)(
+        title=title,
+        content=content,
+        orient=Qt.Orientation.Horizontal,
+        isClosable=True,
+        position=InfoBarPosition.TOP,
+        duration=duration,
+        parent=parent or get_main_container(),
+    )
+
+
 def get_app() -> QApplication:
     """获取 QApplication 实例"""
     app = QApplication.instance()
@@ -1,7 +1,6 @@
 from loguru import logger
 
-from PySide6.QtCore import QSize, QTimer, Signal
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import QSize, Qt, QTimer, Signal
 from qfluentwidgets import (
     FluentIcon,
     MSFluentWindow,
@@ -13,13 +12,16 @@ from qfluentwidgets import (
     setTheme,
 )
 
-from EasiAuto.core.utils import get_resource
 from EasiAuto.models.profile import BaseAutomation
+from EasiAuto.view.components import LazyPage
+from EasiAuto.view.helpers import app_icon
 from EasiAuto.view.pages import AboutPage, AutomationPage, ConfigPage, ProfilePage, UpdatePage
+from EasiAuto.view.pages.about_page import preload_banner
 
 
 class MainWindow(MSFluentWindow):
     runAutomation = Signal(BaseAutomation)
+    closed = Signal()  # 窗口已关闭（随后将被删除，不应再使用）
 
     def __init__(self):
         logger.debug("初始化界面")
@@ -36,7 +38,9 @@ class MainWindow(MSFluentWindow):
         self.automation_page = AutomationPage()
         self.profile_page = ProfilePage()
         self.update_page = UpdatePage()
-        self.about_page = AboutPage()
+        # 关于页不与其他页面交互，首次切换到时再构建
+        self.about_page = LazyPage("AboutPage", AboutPage)
+        preload_banner()
 
         self._init_navigation()
         self._init_signals()
@@ -55,14 +59,16 @@ class MainWindow(MSFluentWindow):
 
     def _init_window(self):
         self.setObjectName("MainWindow")
-        self.setWindowIcon(QIcon(get_resource("icons/EasiAuto.ico")))
+        # 关闭时释放整个窗口（含各页面与设置卡片），再次打开时重新创建
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, True)
+        self.setWindowIcon(app_icon())
         self.setWindowTitle("EasiAuto")
         self.setMinimumSize(800, 500)
         self.resize(960, 640)
 
         self.themeListener = SystemThemeListener(self)
         self.themeListener.setObjectName("SystemThemeListener")
-        qconfig.themeChanged.connect(setTheme)
+        qconfig.themeChanged.connect(self._on_theme_changed)
 
     def _init_signals(self):
         # 登录请求
@@ -75,9 +81,15 @@ class MainWindow(MSFluentWindow):
         self.profile_page.manager_page.scroll_to_automation(automation_id)
         self.switchTo(self.profile_page)
 
+    def _on_theme_changed(self, theme):
+        setTheme(theme)
+
     def closeEvent(self, e):
         self.themeListener.terminate()  # 停止监听器线程
+        self.themeListener.wait()
         super().closeEvent(e)
+        if e.isAccepted():
+            self.closed.emit()
 
     def _onThemeChangedFinished(self):
         super()._onThemeChangedFinished()
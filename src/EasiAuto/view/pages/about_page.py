@@ -1,10 +1,13 @@
+import math
+from functools import cache
+
 from loguru import logger
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QPixmap
+from PySide6.QtCore import QSize, Qt, QThread, Signal
+from PySide6.QtGui import QColor, QImage, QImageReader
 from PySide6.QtWidgets import (
+    QApplication,
     QHBoxLayout,
-    QScroller,
     QVBoxLayout,
     QWidget,
 )
@@ -25,6 +28,95 @@ from qfluentwidgets import (
 from EasiAuto import __version__
 from EasiAuto.consts import IS_FULL
 from EasiAuto.core.utils import get_resource
+from EasiAuto.view.helpers import enable_drag_scroll, shared_icon
+
+BANNER_WIDTH = 600
+AVATAR_RADIUS = 24
+
+LICENSE_TEXT = "本项自基于 GNU General Public License v3.0 (GPLv3) 获得许可"
+THIRD_PARTY_TEXT = "\n  - ".join(
+    [
+        "本项目使用到的第三方库及项目（仅列出部分）：",
+        "qfluentwidget",
+        "PySide6",
+        "Pydantic",
+        "pywinauto",
+        "pyautogui",
+        "opencv-python",
+        "Snoop",
+        "loguru",
+        "sentry-sdk",
+        "windows11toast",
+    ]
+)
+THANKS_TEXT = (
+    "\n  - ".join(
+        [
+            "特别感谢：",
+            "智教联盟 对本项目的宣传",
+            "Class-Widget 对本项目代码提供参考",
+            "ClassIsland 「自动化」 对本项目提供载体",
+            "我的初中英语老师 为本项目提供动机",
+        ]
+    )
+    + "\n\n    以及——愿意使用 EasiAuto 的你"
+)
+
+
+class BannerLoader(QThread):
+    """在后台线程解码主视觉图，并在解码时直接缩放至显示宽度（按屏幕缩放比例换算为设备像素）"""
+
+    loaded = Signal(QImage)
+
+    def __init__(self):
+        super().__init__()
+        self.image: QImage | None = None
+        # 屏幕信息只能在主线程读取
+        screen = QApplication.primaryScreen()
+        self.device_pixel_ratio = screen.devicePixelRatio() if screen is not None else 1.0
+        # 只读取一次文件头，原图尺寸同时用于解码前的页面占位
+        self._reader = QImageReader(get_resource("banner.png"))
+        self.source_size = self._reader.size()
+
+    def run(self):
+        reader = self._reader
+        size = self.source_size
+        if size.isValid() and size.width() > 0:
+            width = math.ceil(BANNER_WIDTH * self.device_pixel_ratio)
+            if width < size.width():
+                reader.setScaledSize(QSize(width, round(size.height() * width / size.width())))
+        image = reader.read()
+        if image.isNull():
+            logger.warning(f"加载主视觉图失败: {reader.errorString()}")
+        else:
+            image.setDevicePixelRatio(image.width() / BANNER_WIDTH)
+        self.image = image
+        self.loaded.emit(image)
+
+
+def load_scaled_image(path: str, min_side: int) -> QImage:
+    """解码图片时直接缩放至短边为 min_side，避免保留原尺寸图像"""
+    reader = QImageReader(path)
+    size = reader.size()
+    if size.isValid() and min(size.width(), size.height()) > min_side:
+        reader.setScaledSize(size.scaled(min_side, min_side, Qt.AspectRatioMode.KeepAspectRatioByExpanding))
+    return reader.read()
+
+
+@cache
+def preload_banner() -> BannerLoader:
+    """开始预加载主视觉图（仅首次调用时启动加载）"""
+    loader = BannerLoader()
+    loader.start()
+    return loader
+
+
+def make_card_layout(card: QWidget, margins: tuple[int, int, int, int]) -> QVBoxLayout:
+    """为卡片创建顶部对齐的垂直布局"""
+    layout = QVBoxLayout(card)
+    layout.setContentsMargins(*margins)
+    layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+    return layout
 
 
 class AboutPage(QWidget):
@@ -47,7 +139,7 @@ class AboutPage(QWidget):
         self.scroll_area = SmoothScrollArea(self)
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        QScroller.grabGesture(self.scroll_area.viewport(), QScroller.ScrollerGestureType.LeftMouseButtonGesture)
+        enable_drag_scroll(self.scroll_area)
         layout.addWidget(self.scroll_area)
 
         # 居中容器
@@ -69,17 +161,29 @@ class AboutPage(QWidget):
 
         # 产品信息卡片
         self.banner_container = CardWidget()
-        banner_container_layout = QVBoxLayout(self.banner_container)
-        banner_container_layout.setContentsMargins(0, 0, 0, 0)
-        banner_container_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-
-        # 主视觉图
-        _banner_img_src = QPixmap(get_resource("banner.png"))
-        banner_image = ImageLabel(_banner_img_src)
-        banner_image.setFixedWidth(600)
-        banner_image.scaledToWidth(600)
-        banner_image.setBorderRadius(8, 8, 0, 0)
-        banner_container_layout.addWidget(banner_image)
+        banner_container_layout = make_card_layout(self.banner_container, (0, 0, 0, 0))
+
+        # 主视觉图（解码结果在进程内共享；尚未解码完成时先按原图比例占位）
+        self.banner_image = ImageLabel()
+        self.banner_image.setBorderRadius(8, 8, 0, 0)
+        banner_container_layout.addWidget(self.banner_image)
+
+        loader = preload_banner()
+        if loader.image is not None:
+            self._on_banner_loaded(loader.image)
+        else:
+            banner_size = loader.source_size
+            if banner_size.isValid() and banner_size.width() > 0:
+                self.banner_image.setFixedSize(
+                    BANNER_WIDTH, round(banner_size.height() * BANNER_WIDTH / banner_size.width())
+                )
+            else:
+                self.banner_image.setFixedWidth(BANNER_WIDTH)
+
+            # 先连接信号再检查结果，避免错过加载完成的时机
+            loader.loaded.connect(self._on_banner_loaded)
+            if loader.image is not None:
+                self._on_banner_loaded(loader.image)
 
         banner_layout = QVBoxLayout()
         banner_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
@@ -101,7 +205,7 @@ class AboutPage(QWidget):
         description_layout = QVBoxLayout()
         product_text = BodyLabel("一款自动登录希沃白板的小工具")
         github_link = HyperlinkCard(
-            icon=FluentIcon.GITHUB,
+            icon=shared_icon(FluentIcon.GITHUB),
             title="GitHub 仓库",
             content="不妨点个 Star 支持一下？  (≧∇≦)ﾉ★",
             url="https://github.com/hxabcd/EasiAuto",
@@ -112,40 +216,9 @@ class AboutPage(QWidget):
         )
         additional_info.viewLayout.setContentsMargins(16, 8, 16, 12)
         additional_info.viewLayout.setSpacing(6)
-        additional_info.addGroupWidget(BodyLabel("本项自基于 GNU General Public License v3.0 (GPLv3) 获得许可"))
-        additional_info.addGroupWidget(
-            BodyLabel(
-                "\n  - ".join(
-                    [
-                        "本项目使用到的第三方库及项目（仅列出部分）：",
-                        "qfluentwidget",
-                        "PySide6",
-                        "Pydantic",
-                        "pywinauto",
-                        "pyautogui",
-                        "opencv-python",
-                        "Snoop",
-                        "loguru",
-                        "sentry-sdk",
-                        "windows11toast",
-                    ]
-                )
-            )
-        )
-        additional_info.addGroupWidget(
-            BodyLabel(
-                "\n  - ".join(
-                    [
-                        "特别感谢：",
-                        "智教联盟 对本项目的宣传",
-                        "Class-Widget 对本项目代码提供参考",
-                        "ClassIsland 「自动化」 对本项目提供载体",
-                        "我的初中英语老师 为本项目提供动机",
-                    ]
-                )
-                + "\n\n    以及——愿意使用 EasiAuto 的你"
-            )
-        )
+        additional_info.addGroupWidget(BodyLabel(LICENSE_TEXT))
+        additional_info.addGroupWidget(BodyLabel(THIRD_PARTY_TEXT))
+        additional_info.addGroupWidget(BodyLabel(THANKS_TEXT))
         description_layout.addWidget(product_text)
         description_layout.addWidget(github_link)
         description_layout.addWidget(additional_info)
@@ -157,14 +230,12 @@ class AboutPage(QWidget):
 
         # 作者信息卡片
         self.author_area = CardWidget()
-        author_layout = QVBoxLayout(self.author_area)
-        author_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        author_layout.setContentsMargins(24, 16, 24, 16)
+        author_layout = make_card_layout(self.author_area, (24, 16, 24, 16))
 
         author_info_layout = QHBoxLayout()
 
-        author_avatar = AvatarWidget(QPixmap(get_resource("author_avatar.jpg")))
-        author_avatar.setRadius(24)
+        author_avatar = AvatarWidget(load_scaled_image(get_resource("author_avatar.jpg"), AVATAR_RADIUS * 4))
+        author_avatar.setRadius(AVATAR_RADIUS)
 
         sub_layout = QVBoxLayout()
         sub_layout.setSpacing(0)
@@ -180,19 +251,19 @@ class AboutPage(QWidget):
         author_info_layout.addStretch(1)
 
         author_link1 = HyperlinkCard(
-            icon=FluentIcon.GLOBE,
+            icon=shared_icon(FluentIcon.GLOBE),
             title="个人网站",
             url="https://0xabcd.dev",
             text="访问",
         )
         author_link2 = HyperlinkCard(
-            icon=FluentIcon.HOME_FILL,
+            icon=shared_icon(FluentIcon.HOME_FILL),
             title="哔哩哔哩主页",
             url="https://space.bilibili.com/401002238",
             text="访问",
         )
         author_link3 = HyperlinkCard(
-            icon=FluentIcon.GITHUB,
+            icon=shared_icon(FluentIcon.GITHUB),
             title="GitHub 主页",
             url="https://github.com/hxabcd",
             text="访问",
@@ -206,3 +277,9 @@ class AboutPage(QWidget):
 
         self.content_layout.addWidget(self.author_area)
         self.content_layout.addStretch(1)
+
+    def _on_banner_loaded(self, image: QImage):
+        if image.isNull():
+            return
+        self.banner_image.setImage(image)
+        self.banner_image.setFixedSize(image.deviceIndependentSize().toSize())
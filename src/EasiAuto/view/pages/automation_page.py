@@ -1,11 +1,12 @@
 import contextlib
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import assert_never
 
 from loguru import logger
 
-from PySide6.QtCore import Qt, QTimer, QUrl, Signal
+from PySide6.QtCore import Qt, QTimer, QUrl, QWinEventNotifier, Signal
 from PySide6.QtGui import QDesktopServices
 from PySide6.QtWidgets import (
     QFileDialog,
@@ -20,8 +21,6 @@ from qfluentwidgets import (
     FluentIcon,
     HorizontalSeparator,
     IconWidget,
-    InfoBar,
-    InfoBarPosition,
     InfoLevel,
     LineEdit,
     MessageBoxBase,
@@ -30,6 +29,7 @@ from qfluentwidgets import (
     SubtitleLabel,
     TitleLabel,
     TransparentPushButton,
+    qconfig,
 )
 
 from EasiAuto.core.utils import get_ci_executable
@@ -37,7 +37,7 @@ from EasiAuto.integrations.classisland_manager import classisland_manager as ci_
 from EasiAuto.models.config import config
 from EasiAuto.models.profile import ProfileChangeReason, profile
 from EasiAuto.view.components import SettingCard
-from EasiAuto.view.helpers import Icons, get_main_container, set_enable_by
+from EasiAuto.view.helpers import Icons, cached_icon, set_enable_by, show_info_bar
 
 from .binding_page import BindingPage
 
@@ -82,6 +82,12 @@ class AdvancedOptionsDialog(MessageBoxBase):
         )
 
 
+# 状态监听轮询间隔（毫秒），状态长时间未变化时逐级放缓
+WATCHER_INTERVALS = (200, 1000, 3000)
+# 每级放缓前需连续未变化的检查次数
+WATCHER_IDLE_TICKS = 25
+
+
 class CIStatus(Enum):
     UNINITIALIZED = -1
     DIED = 0
@@ -122,7 +128,11 @@ class StatusBar(QWidget):
         layout.addWidget(self.reload_button)
         layout.addWidget(self.option_button)
 
-        self.update_status()
+        # 合并短时间内的多次状态更新请求，每帧只刷新一次
+        self._update_pending = False
+        self._pending_status: CIStatus | None = None
+        self._last_status: CIStatus | None = None
+        self._apply_status()
 
     def _show_advanced_settings(self):
         """显示高级设置对话框"""
@@ -130,12 +140,27 @@ class StatusBar(QWidget):
         w.exec()
 
     def update_status(self, status: CIStatus | None = None):
+        self._pending_status = status
+        if not self._update_pending:
+            self._update_pending = True
+            QTimer.singleShot(0, self._flush_status)
+
+    def _flush_status(self):
+        self._update_pending = False
+        self._apply_status(self._pending_status)
+
+    def _apply_status(self, status: CIStatus | None = None):
         if status is None:
             if ci_manager:
                 status = CIStatus.RUNNING if ci_manager.is_running else CIStatus.DIED
             else:
                 status = CIStatus.UNINITIALIZED
 
+        # 状态未变化时无需重设控件，避免多余的重绘
+        if status == self._last_status:
+            return
+        self._last_status = status
+
         match status:
             case CIStatus.UNINITIALIZED:
                 self.status_badge.level = InfoLevel.ERROR
@@ -175,15 +200,17 @@ class PathSelectSubpage(QWidget):
 
     def __init__(self):
         super().__init__()
+        self._file_dialog: QFileDialog | None = None
 
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         icon_container = QHBoxLayout()
         icon_container.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        hint_icon = IconWidget(FluentIcon.REMOVE_FROM)
-        hint_icon.setFixedSize(96, 96)
-        icon_container.addWidget(hint_icon)
+        self.hint_icon = IconWidget(cached_icon(FluentIcon.REMOVE_FROM, 96))
+        self.hint_icon.setFixedSize(96, 96)
+        qconfig.themeChanged.connect(self._on_theme_changed)
+        icon_container.addWidget(self.hint_icon)
 
         hint_label = TitleLabel("未能获取到 ClassIsland 路径")
         hint_desc = BodyLabel("<span style='font-size: 15px;'>EasiAuto 的「自动化」功能依赖于 ClassIsland</span>")
@@ -213,45 +240,38 @@ class PathSelectSubpage(QWidget):
         layout.addSpacing(18)
         layout.addLayout(actions_layout)
 
+    def _on_theme_changed(self):
+        self.hint_icon.setIcon(cached_icon(FluentIcon.REMOVE_FROM, 96))
+
     def browse_ci_path(self):
         logger.debug("打开文件选择对话框")
-        exe_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "选择 ClassIsland 程序路径",
-            "D:/" if Path("D:/").exists() else "C:/",
-            "ClassIsland 可执行文件 (ClassIsland.exe)",
-        )
+        # 使用 open() 异步显示对话框，避免静态方法在嵌套事件循环中阻塞调用方
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(
+                self,
+                "选择 ClassIsland 程序路径",
+                "D:/" if Path("D:/").exists() else "C:/",
+                "ClassIsland 可执行文件 (ClassIsland.exe)",
+            )
+            self._file_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            self._file_dialog.fileSelected.connect(self._on_ci_path_selected)
+            self._file_dialog.rejected.connect(lambda: logger.debug("取消文件选择"))
+        self._file_dialog.open()
 
-        if not exe_path:  # 取消选择
-            logger.debug("取消文件选择")
+    def _on_ci_path_selected(self, exe_path: str):
+        if not exe_path:
             return
 
         logger.info(f"选择 ClassIsland 路径: {exe_path}")
         exe_path = Path(exe_path)
         if exe_path.exists():
-            InfoBar.info(
-                title="信息",
-                content="已关闭自动路径获取",
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=3000,
-                parent=get_main_container(),
-            )
+            show_info_bar("info", "信息", "已关闭自动路径获取")
             config.ClassIsland.AutoPath = False
             config.ClassIsland.Path = str(exe_path)
             self.pathChanged.emit(exe_path)
         else:
             logger.error("选择的路径不存在")
-            InfoBar.error(
-                title="错误",
-                content="选择的路径不存在",
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=3000,
-                parent=get_main_container(),
-            )
+            show_info_bar("error", "错误", "选择的路径不存在")
 
 
 class ImportLegacySubpage(QWidget):
@@ -265,9 +285,10 @@ class ImportLegacySubpage(QWidget):
 
         icon_container = QHBoxLayout()
         icon_container.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        hint_icon = IconWidget(FluentIcon.INFO)
-        hint_icon.setFixedSize(96, 96)
-        icon_container.addWidget(hint_icon)
+        self.hint_icon = IconWidget(cached_icon(FluentIcon.INFO, 96))
+        self.hint_icon.setFixedSize(96, 96)
+        qconfig.themeChanged.connect(self._on_theme_changed)
+        icon_container.addWidget(self.hint_icon)
 
         hint_label = TitleLabel("需要更新自动化")
         hint_desc = BodyLabel(
@@ -292,30 +313,17 @@ class ImportLegacySubpage(QWidget):
         layout.addSpacing(18)
         layout.addLayout(actions_layout)
 
+    def _on_theme_changed(self):
+        self.hint_icon.setIcon(cached_icon(FluentIcon.INFO, 96))
+
     def on_import_legacy(self):
         self.import_button.setEnabled(False)
         try:
             ok, message = ci_manager.import_legacy_automation()
             if ok:
-                InfoBar.success(
-                    title="更新成功",
-                    content=message,
-                    orient=Qt.Orientation.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=4000,
-                    parent=get_main_container(),
-                )
+                show_info_bar("success", "更新成功", message, duration=4000)
             else:
-                InfoBar.error(
-                    title="更新失败",
-                    content=message,
-                    orient=Qt.Orientation.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=4000,
-                    parent=get_main_container(),
-                )
+                show_info_bar("error", "更新失败", message, duration=4000)
         finally:
             self.import_button.setEnabled(True)
 
@@ -364,13 +372,20 @@ class CiRunningWarnOverlay(QWidget):
         layout.addSpacing(18)
         layout.addWidget(self.action_button, alignment=Qt.AlignmentFlag.AlignHCenter)
 
+        self._failed = False
         self.set_text()
+        # 连接绑定方法而非捕获 self 的 lambda，页面销毁后连接会随之断开
+        qconfig.themeChanged.connect(self._refresh_text)
         with contextlib.suppress(KeyError):
-            SettingCard.index["Debug.EasterEggEnabled"].valueChanged.connect(lambda _: self.set_text())
+            SettingCard.index["Debug.EasterEggEnabled"].valueChanged.connect(self._refresh_text)
+
+    def _refresh_text(self):
+        self.set_text(self._failed)
 
     def set_text(self, failed: bool = False):
+        self._failed = failed
         if not failed:
-            self.hint_icon.setIcon(Icons.ClassIsland)
+            self.hint_icon.setIcon(cached_icon(Icons.ClassIsland, 96))
             if config.Debug.EasterEggEnabled:
                 self.hint_label.setText(self.labelE_running_text)
                 self.hint_desc.setText(self.labelE_running_desc)
@@ -379,10 +394,10 @@ class CiRunningWarnOverlay(QWidget):
                 self.hint_desc.setText(self.label_running_desc)
                 self.action_button.show()
         else:
-            self.hint_icon.setIcon(FluentIcon.QUESTION)
+            self.hint_icon.setIcon(cached_icon(FluentIcon.QUESTION, 96))
             if config.Debug.EasterEggEnabled:
                 self.hint_label.setText(self.labelE_failed_text)
-                self.hint_desc.setText(self.labelE_failed_text)
+                self.hint_desc.setText(self.labelE_failed_desc)
             else:
                 self.hint_label.setText(self.label_failed_text)
                 self.hint_desc.setText(self.label_failed_desc)
@@ -430,6 +445,10 @@ class AutomationPage(QWidget):
         else:
             logger.warning(f"{'未找到 ClassIsland 路径' if not exe_path else '路径无效'}, 跳过初始化")
 
+        # ClassIsland 运行期间等待其进程退出，退出时立即检查状态，无需依赖轮询
+        self._exit_handle = None
+        self._exit_notifier: QWinEventNotifier | None = None
+
         self.init_ui()
         self._init_model_subscriptions()
         self.start_watcher()
@@ -442,34 +461,47 @@ class AutomationPage(QWidget):
         self.status_bar = StatusBar()
         self.main_widget = QStackedWidget()
 
-        self.path_select_page = PathSelectSubpage()
-        self.import_legacy_page = ImportLegacySubpage()
-        self.overlay_page = CiRunningWarnOverlay()
         self.binding_page = BindingPage()
 
         self.binding_page.bindingsChanged.connect(self.bindingsChanged)
         self.binding_page.editClicked.connect(self.editClicked)
         self.status_bar.reloadClicked.connect(lambda: self.binding_page.reload(reload=True))
 
-        self.main_widget.addWidget(self.path_select_page)
-        self.main_widget.addWidget(self.import_legacy_page)
-        self.main_widget.addWidget(self.overlay_page)
+        # 其余子页面在首次需要时才创建
         self.main_widget.addWidget(self.binding_page)
-
-        if ci_manager:
-            self.main_widget.setCurrentWidget(self.binding_page)
-
-        self.path_select_page.pathChanged.connect(self.handle_path_changed)
+        if not ci_manager:
+            self.main_widget.setCurrentWidget(self.path_select_page)
 
         layout.addWidget(self.status_bar)
         layout.addWidget(HorizontalSeparator())
         layout.addWidget(self.main_widget)
 
+    @cached_property
+    def path_select_page(self) -> PathSelectSubpage:
+        page = PathSelectSubpage()
+        page.pathChanged.connect(self.handle_path_changed)
+        self.main_widget.addWidget(page)
+        return page
+
+    @cached_property
+    def import_legacy_page(self) -> ImportLegacySubpage:
+        page = ImportLegacySubpage()
+        self.main_widget.addWidget(page)
+        return page
+
+    @cached_property
+    def overlay_page(self) -> CiRunningWarnOverlay:
+        page = CiRunningWarnOverlay()
+        self.main_widget.addWidget(page)
+        return page
+
     def _init_model_subscriptions(self):
         self._reload_debounce = QTimer(self)
         self._reload_debounce.setSingleShot(True)
         self._reload_debounce.timeout.connect(self._reload_binding_page)
         self._ci_signal_connected = False
+        # 关联页数据是否需要刷新（BindingPage 构造时已加载一次）
+        self._binding_dirty = False
 
         profile.notifier.changed.connect(self._on_profile_changed)
         self._connect_ci_manager_signal()
@@ -483,10 +515,15 @@ class AutomationPage(QWidget):
             self._schedule_binding_reload()
 
     def _schedule_binding_reload(self):
-        self._reload_debounce.start(120)
+        self._binding_dirty = True
+        # 页面不可见时仅标记，待下次显示时再刷新
+        if self.isVisible():
+            self._reload_debounce.start(120)
 
     def _reload_binding_page(self):
-        if hasattr(self, "binding_page"):
+        self._reload_debounce.stop()
+        if self._binding_dirty and hasattr(self, "binding_page"):
+            self._binding_dirty = False
             self.binding_page.reload()
 
     def _connect_ci_manager_signal(self):
@@ -503,33 +540,104 @@ class AutomationPage(QWidget):
 
         if hasattr(self, "watcher"):
             logger.debug("状态监听已启动")
+            self._boost_watcher()
             return
 
         logger.info("启动 ClassIsland 状态监听")
         self.check_status()
 
+        self._idle_ticks = 0
         self.watcher = QTimer(self)
         self.watcher.timeout.connect(self.check_status)
-        self.watcher.start(200)
+        self.watcher.setInterval(WATCHER_INTERVALS[0])
+        self.status_bar.action_button.clicked.connect(self._boost_watcher)
+        # 页面不可见时不轮询，由 showEvent 恢复
+        if self.isVisible():
+            self.watcher.start()
+
+    def _boost_watcher(self):
+        """状态可能即将变化，恢复为最快的轮询间隔"""
+        if not hasattr(self, "watcher"):
+            return
+        self._idle_ticks = 0
+        self.watcher.setInterval(WATCHER_INTERVALS[0])
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._binding_dirty:
+            self._reload_debounce.start(120)
+        if hasattr(self, "watcher") and not self.watcher.isActive():
+            self.check_status()
+            self._boost_watcher()
+            self.watcher.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if hasattr(self, "watcher"):
+            self.watcher.stop()
+
+    def _watch_ci_exit(self):
+        """等待 ClassIsland 进程退出"""
+        if self._exit_notifier is not None or not ci_manager:
+            return
+        if (handle := ci_manager.open_process_handle()) is None:
+            return
+
+        self._exit_handle = handle
+        self._exit_notifier = QWinEventNotifier(int(handle), self)
+        self._exit_notifier.activated.connect(self._on_ci_exited)
+        self._exit_notifier.setEnabled(True)
+
+    def _release_ci_exit_notifier(self):
+        if self._exit_notifier is not None:
+            self._exit_notifier.setEnabled(False)
+            self._exit_notifier.deleteLater()
+            self._exit_notifier = None
+        if self._exit_handle is not None:
+            self._exit_handle.Close()
+            self._exit_handle = None
+
+    def _on_ci_exited(self):
+        # 进程句柄退出后保持有信号状态，需先释放以免重复触发
+        self._release_ci_exit_notifier()
+        self._boost_watcher()
+        self.check_status()
 
     def check_status(self):
         """检查状态并切换页面"""
         target_page: QWidget
+        # 状态在此一并确定并传给状态栏，状态栏无需再次探测
         if not ci_manager:
-            target_page = self.path_select_page
+            target_page, status = self.path_select_page, CIStatus.UNINITIALIZED
         elif ci_manager.is_running:
-            target_page = self.overlay_page
+            target_page, status = self.overlay_page, CIStatus.RUNNING
         elif ci_manager.is_imports_available:
-            target_page = self.import_legacy_page
+            target_page, status = self.import_legacy_page, CIStatus.DIED
         else:
-            target_page = self.binding_page
+            target_page, status = self.binding_page, CIStatus.DIED
 
-        if self.main_widget.currentWidget() != target_page:
+        if (current_page := self.main_widget.currentWidget()) != target_page:
             logger.debug(f"切换自动化页面到: {target_page.__class__.__name__}")
+            # ClassIsland 运行期间或路径变更后数据可能已改变，需要刷新
+            if current_page is not self.binding_page:
+                self._binding_dirty = True
             self.main_widget.setCurrentWidget(target_page)
             if target_page == self.binding_page:
-                self.binding_page.reload()
-            self.status_bar.update_status()
+                self._reload_binding_page()
+            self.status_bar.update_status(status)
+            self._boost_watcher()
+            if target_page == self.overlay_page:
+                self._watch_ci_exit()
+            else:
+                self._release_ci_exit_notifier()
+        elif hasattr(self, "watcher"):
+            # 状态长时间未变化时逐级放缓轮询
+            self._idle_ticks += 1
+            stage = min(self._idle_ticks // WATCHER_IDLE_TICKS, len(WATCHER_INTERVALS) - 1)
+            if self._exit_notifier is not None:
+                stage = len(WATCHER_INTERVALS) - 1  # 退出由进程句柄通知，轮询只作兜底
+            if self.watcher.interval() != WATCHER_INTERVALS[stage]:
+                self.watcher.setInterval(WATCHER_INTERVALS[stage])
 
     def handle_path_changed(self, path: Path):
         """重设 ClassIsland 管理器"""
@@ -540,15 +648,7 @@ class AutomationPage(QWidget):
             logger.success("ClassIsland 管理器初始化成功")
         except Exception as e:
             logger.error(f"ClassIsland 管理器初始化失败: {e}")
-            InfoBar.error(
-                title="错误",
-                content="无法初始化管理器，请检查路径是否正确",
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=3000,
-                parent=get_main_container(),
-            )
+            show_info_bar("error", "错误", "无法初始化管理器，请检查路径是否正确")
             return
 
         self._connect_ci_manager_signal()
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from loguru import logger
 
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtWidgets import QFrame, QGridLayout, QHBoxLayout, QScroller, QVBoxLayout, QWidget
+from PySide6.QtWidgets import QFrame, QGridLayout, QHBoxLayout, QVBoxLayout, QWidget
 from qfluentwidgets import (
     Action,
     AvatarWidget,
@@ -14,8 +14,6 @@ from qfluentwidgets import (
     CommandBar,
     FluentIcon,
     IconWidget,
-    InfoBar,
-    InfoBarPosition,
     SmoothScrollArea,
     SubtitleLabel,
     VerticalSeparator,
@@ -23,7 +21,7 @@ from qfluentwidgets import (
 
 from EasiAuto.models.profile import BaseAutomation, EasiAutomation, QrCodeAutomation, profile
 from EasiAuto.services.binding_service import ClassIslandBindingBackend, SubjectRef
-from EasiAuto.view.helpers import get_main_container
+from EasiAuto.view.helpers import enable_drag_scroll, show_info_bar
 
 
 @dataclass
@@ -243,7 +241,7 @@ class BindingPage(QWidget):
         self.subject_scroll.setWidgetResizable(True)
         self.subject_scroll.setFrameShape(SmoothScrollArea.Shape.NoFrame)
         self.subject_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        QScroller.grabGesture(self.subject_scroll.viewport(), QScroller.ScrollerGestureType.LeftMouseButtonGesture)
+        enable_drag_scroll(self.subject_scroll)
 
         self.subject_container = QWidget()
         self.subject_grid = QGridLayout(self.subject_container)
@@ -264,7 +262,7 @@ class BindingPage(QWidget):
         self.profile_scroll.setWidgetResizable(True)
         self.profile_scroll.setFrameShape(SmoothScrollArea.Shape.NoFrame)
         self.profile_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        QScroller.grabGesture(self.profile_scroll.viewport(), QScroller.ScrollerGestureType.LeftMouseButtonGesture)
+        enable_drag_scroll(self.profile_scroll)
 
         self.profile_container = QWidget()
         self.profile_layout = QVBoxLayout(self.profile_container)
@@ -548,14 +546,6 @@ class BindingPage(QWidget):
             content = "；".join(errors[:3]) if errors else "请检查 ClassIsland 状态与配置"
             if len(errors) > 3:
                 content += "；..."
-            InfoBar.error(
-                title="同步存在失败项",
-                content=content,
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=5000,
-                parent=get_main_container(),
-            )
+            show_info_bar("error", "同步存在失败项", content, duration=5000)
 
         self.bindingsChanged.emit()
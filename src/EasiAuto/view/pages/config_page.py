@@ -1,19 +1,15 @@
-import weakref
 from typing import cast
 
 from loguru import logger
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
-    QScroller,
     QVBoxLayout,
     QWidget,
 )
 from qfluentwidgets import (
     ExpandGroupSettingCard,
     FluentIcon,
-    InfoBar,
-    InfoBarPosition,
     MessageBox,
     PushSettingCard,
     SmoothScrollArea,
@@ -29,7 +25,7 @@ from EasiAuto.models.config import ConfigGroup, LoginMethod, config
 from EasiAuto.services.announcement_service import Announcement, announcement_service
 from EasiAuto.view.components import AnnouncementCard, ExpandSelectorSettingCard, SettingCard
 from EasiAuto.view.components.qfw_widgets import SettingCardGroup
-from EasiAuto.view.helpers import get_main_container, set_enable_by
+from EasiAuto.view.helpers import enable_drag_scroll, get_main_container, set_enable_by, show_info_bar
 
 # 从属关系映射: [!]Condition -> Targets
 ENABLE_MAPPING: dict[str, str | list[str]] = {
@@ -42,6 +38,28 @@ ENABLE_MAPPING: dict[str, str | list[str]] = {
     "Banner.Enabled": "Banner.Style",
 }
 
+# 重置按钮: Path -> 显示名称
+RESETTER_MAPPING: dict[str, str] = {
+    "Login.EasiNote": "希沃白板选项",
+    "Login.Timeout": "等待时长",
+    "Login.Position": "位置坐标",
+    "Banner.Style": "横幅样式",
+}
+
+# 控件宽度: Name -> (是否固定宽度, 宽度)
+WIDTH_RULES: dict[str, tuple[bool, int]] = {
+    **{
+        f"Login.EasiNote.{field}": (True, 300) for field in ["Path", "ProcessName", "WindowTitle", "Args", "ExtraKills"]
+    },
+    "Banner.Style.Text": (True, 420),
+    "Banner.Style.TextFont": (True, 200),
+    "App.LogLevel": (False, 104),
+}
+# 控件宽度（前缀匹配）: Prefix -> (是否固定宽度, 宽度)
+PREFIX_WIDTH_RULES: dict[str, tuple[bool, int]] = {
+    "Login.Timeout.": (False, 160),
+}
+
 
 class ConfigPage(QWidget):
     """设置 - 配置页"""
@@ -50,7 +68,7 @@ class ConfigPage(QWidget):
         super().__init__()
         logger.debug("初始化配置页")
 
-        self.menu_index: weakref.WeakValueDictionary[str, SettingCardGroup] = weakref.WeakValueDictionary()
+        self.menu_index: dict[str, SettingCardGroup] = {}
         self.init_ui()
         self._init_announcement_signals()
         announcement_service.fetch_async()
@@ -78,7 +96,7 @@ class ConfigPage(QWidget):
         self.scroll_area = SmoothScrollArea(self)
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        QScroller.grabGesture(self.scroll_area.viewport(), QScroller.ScrollerGestureType.LeftMouseButtonGesture)
+        enable_drag_scroll(self.scroll_area)
         layout.addWidget(self.scroll_area)
 
         # 创建内容容器
@@ -152,10 +170,7 @@ class ConfigPage(QWidget):
         card_group.setObjectName(config.name)
         self.menu_index[config.name] = card_group
 
-        for item in config.children:
-            card = SettingCard.from_config(item)
-
-            card_group.addSettingCard(card)
+        card_group.addSettingCards([SettingCard.from_config(item) for item in config.children])
 
         self.content_layout.addWidget(card_group)
 
@@ -190,8 +205,22 @@ class ConfigPage(QWidget):
         self.content_layout.addWidget(collapse_card)
         collapse_card.setVisible(config.Debug.DebugMode)
 
+        index = SettingCard.index
+
+        # 控件宽度
+        width_rules = [(index.get(name), rule) for name, rule in WIDTH_RULES.items()]
+        for prefix, rule in PREFIX_WIDTH_RULES.items():
+            width_rules += [(card, rule) for name, card in index.items() if name.startswith(prefix)]
+        for card, (fixed, width) in width_rules:
+            if not isinstance(card, SettingCard):
+                continue
+            if fixed:
+                card.widget.setFixedWidth(width)
+            else:
+                card.widget.setMinimumWidth(width)
+
         # 额外属性
-        for name, card in SettingCard.index.items():
+        for name, card in index.items():
             match name:
                 case "Login.Method":
                     card = cast(ExpandSelectorSettingCard, card)
@@ -211,24 +240,6 @@ class ConfigPage(QWidget):
                     card.hBoxLayout.insertWidget(5, button_card)
                     card.hBoxLayout.insertSpacing(6, 12)
 
-                case "Login.EasiNote":
-                    card = cast(ExpandGroupSettingCard, card)
-                    self.add_resetter(card, "Login.EasiNote", "希沃白板选项")
-
-                case n if n in [
-                    f"Login.EasiNote.{field}" for field in ["Path", "ProcessName", "WindowTitle", "Args", "ExtraKills"]
-                ]:
-                    card = cast(SettingCard, card)
-                    card.widget.setFixedWidth(300)
-
-                case "Login.Timeout":
-                    card = cast(ExpandGroupSettingCard, card)
-                    self.add_resetter(card, "Login.Timeout", "等待时长")
-
-                case n if n.startswith("Login.Timeout."):
-                    card = cast(SettingCard, card)
-                    card.widget.setMinimumWidth(160)
-
                 case "Login.Position":
                     card = cast(ExpandGroupSettingCard, card)
                     record_card = PushSettingCard(
@@ -236,34 +247,25 @@ class ConfigPage(QWidget):
                     )
                     record_card.setEnabled(False)  # TODO: 录制模式
                     card.addGroupWidget(record_card)
-                    self.add_resetter(card, "Login.Position", "位置坐标")
-                case "Banner.Style":
-                    card = cast(ExpandGroupSettingCard, card)
-                    self.add_resetter(card, "Banner.Style", "横幅样式")
-
-                case "Banner.Style.Text":
-                    card = cast(SettingCard, card)
-                    card.widget.setFixedWidth(420)
 
                 case "Banner.Style.TextFont":
                     card = cast(SettingCard, card)
-                    card.widget.setFixedWidth(200)
                     card.widget.setClearButtonEnabled(True)  # type: ignore
 
-                case "App.LogLevel":
-                    card = cast(SettingCard, card)
-                    card.widget.setMinimumWidth(104)
-
                 case "App.Theme":
                     card = cast(SettingCard, card)
                     card.valueChanged.connect(lambda t: setTheme(Theme(t.value)))
 
+        # 重置按钮（添加在各组末尾）
+        for path, display_name in RESETTER_MAPPING.items():
+            self.add_resetter(cast(ExpandGroupSettingCard, index[path]), path, display_name)
+
         # 从属关系
         for condition, _targets in ENABLE_MAPPING.items():
             targets = _targets if isinstance(_targets, list) else [_targets]
             set_enable_by(
-                switch=SettingCard.index[condition.removeprefix("!")].widget,  # type: ignore
-                widgets=[SettingCard.index[t] for t in targets],
+                switch=index[condition.removeprefix("!")].widget,  # type: ignore
+                widgets=[index[t] for t in targets],
                 reverse=condition.startswith("!"),
             )
 
@@ -279,39 +281,25 @@ class ConfigPage(QWidget):
 
     def reset_settings_by_path(self, path: str, display_name: str = "设置"):
         config.reset_by_path(path)
-        SettingCard.update_all()
+        SettingCard.update_all(path)
 
         # 弹出提示
-        InfoBar.success(
-            title="成功",
-            content=f"{display_name}已重置",
-            orient=Qt.Orientation.Horizontal,
-            isClosable=True,
-            position=InfoBarPosition.TOP,
-            duration=3000,
-            parent=get_main_container(),
-        )
+        show_info_bar("success", "成功", f"{display_name}已重置")
 
     def reset_config(self):
         """重置配置为默认值"""
         title = "确认要重置配置吗？"
         content = "所有已编辑的设置将丢失，是否继续？"
-        w = MessageBox(title, content, self)
-
-        w.setClosableOnMaskClicked(True)
+        dialog = MessageBox(title, content, self)
+        dialog.setClosableOnMaskClicked(True)
 
-        if w.exec():
+        # 关闭后即释放对话框，避免每次点击都在页面下累积一个子对话框
+        confirmed = dialog.exec()
+        dialog.deleteLater()
+        if confirmed:
             # 重置设置
             config.reset_all()
             SettingCard.update_all()
 
             # 弹出提示
-            InfoBar.success(
-                title="成功",
-                content="设置已重置",
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=3000,
-                parent=get_main_container(),
-            )
+            show_info_bar("success", "成功", "设置已重置")
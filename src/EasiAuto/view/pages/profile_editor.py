@@ -2,16 +2,16 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import requests
 from loguru import logger
 
-from PySide6.QtCore import QSize, Qt, Signal
+from PySide6.QtCore import QSignalBlocker, QSize, Qt, QThread, QTimer, Signal
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QDialog,
-    QFormLayout,
+    QGridLayout,
     QHBoxLayout,
     QListWidgetItem,
-    QScroller,
     QVBoxLayout,
     QWidget,
 )
@@ -24,8 +24,6 @@ from qfluentwidgets import (
     FluentIcon,
     HorizontalSeparator,
     IconInfoBadge,
-    InfoBar,
-    InfoBarPosition,
     LineEdit,
     MessageBoxBase,
     PasswordLineEdit,
@@ -36,7 +34,7 @@ from qfluentwidgets import (
     VerticalSeparator,
 )
 
-from EasiAuto.consts import IS_FULL
+from EasiAuto.consts import CACHE_DIR, IS_FULL
 from EasiAuto.core.utils import create_shortcut
 from EasiAuto.integrations.classisland_manager import classisland_manager as ci_manager
 from EasiAuto.models.profile import BaseAutomation, EasiAutomation, ProfileChangeReason, QrCodeAutomation, profile
@@ -45,7 +43,7 @@ from EasiAuto.view.components import SettingCard
 from EasiAuto.view.components.qfw_widgets import ListWidget, PillOverflowBar, PillPushButton
 from EasiAuto.view.components.qrcode_login_dialog import QRCodeLoginDialog, fetch_qrcode_avatar
 from EasiAuto.view.components.setting_card import CardType
-from EasiAuto.view.helpers import get_main_container, get_main_window
+from EasiAuto.view.helpers import enable_drag_scroll, get_main_container, get_main_window, shared_icon, show_info_bar
 
 
 class AdvancedOptionsDialog(MessageBoxBase):
@@ -180,17 +178,17 @@ class ProfileCard(CardWidget):
         self.command_bar.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
 
         self.action_run = Action(
-            FluentIcon.PLAY,
+            shared_icon(FluentIcon.PLAY),
             "运行",
             triggered=self._on_run,
         )
         self.action_export = Action(
-            FluentIcon.SHARE,
+            shared_icon(FluentIcon.SHARE),
             "导出",
             triggered=self._on_export,
         )
         self.action_remove = Action(
-            FluentIcon.CANCEL_MEDIUM,
+            shared_icon(FluentIcon.CANCEL_MEDIUM),
             "删除",
             triggered=lambda: self.actionRemove.emit(self.list_item),
         )
@@ -249,10 +247,11 @@ class ProfileCard(CardWidget):
 
     def update_display(self, automation: BaseAutomation):
         self._automation_id = automation.id
-        self.name_label.setText(self.automation.display_name or "未命名自动化")
-        self.detail_label.setText(self.automation.detail_name or "")
-        self.enabled_switch.setChecked(automation.enabled)
-        self.detail_label.setText(self.automation.detail_name or "")
+        self.name_label.setText(automation.display_name or "未命名自动化")
+        self.detail_label.setText(automation.detail_name or "")
+        # 仅同步显示，不应再触发启用状态变更
+        with QSignalBlocker(self.enabled_switch):
+            self.enabled_switch.setChecked(automation.enabled)
 
     def set_subject_tags(self, tags: list[str]):
         self._update_subjects(tags)
@@ -267,6 +266,38 @@ class ProfileCard(CardWidget):
         super().mousePressEvent(e)
 
 
+class AvatarRefreshThread(QThread):
+    """在后台获取并缓存二维码登录用户的头像，避免网络请求阻塞界面"""
+
+    refreshed = Signal(dict)  # 自动化 ID -> 头像缓存路径
+
+    # 线程不挂在页面下（页面可能随窗口关闭被销毁），运行期间由此处持有引用，结束后自行释放
+    _running: set[AvatarRefreshThread] = set()
+
+    def __init__(self, targets: list[tuple[str, str, str]]):
+        super().__init__()
+        self.targets = targets
+        self._running.add(self)
+        self.finished.connect(self._release)
+
+    def _release(self):
+        self._running.discard(self)
+        self.deleteLater()
+
+    def run(self):
+        updates: dict[str, str] = {}
+        for automation_id, token, user_id in self.targets:
+            if self.isInterruptionRequested():
+                return
+            avatar_url = fetch_qrcode_avatar(token)
+            if not avatar_url:
+                continue
+            if new_path := ProfileManagePage._cache_qrcode_avatar(user_id, avatar_url):
+                updates[automation_id] = new_path
+        if not self.isInterruptionRequested():
+            self.refreshed.emit(updates)
+
+
 class ProfileManagePage(QWidget):
     """档案编辑页"""
 
@@ -279,6 +310,7 @@ class ProfileManagePage(QWidget):
         self.current_list_item: QListWidgetItem | None = None
         self.is_new_automation = False
         self.binding_backend = ClassIslandBindingBackend()
+        self._items: dict[str, QListWidgetItem] = {}  # 自动化 ID -> 列表项
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -305,7 +337,7 @@ class ProfileManagePage(QWidget):
 
         self.auto_list = ListWidget()
         self.auto_list.setSpacing(3)
-        QScroller.grabGesture(self.auto_list.viewport(), QScroller.ScrollerGestureType.LeftMouseButtonGesture)
+        enable_drag_scroll(self.auto_list)
 
         self.selector_layout.addWidget(self.action_bar)
         self.selector_layout.addWidget(self.auto_list)
@@ -328,18 +360,28 @@ class ProfileManagePage(QWidget):
         self.automation_name_label = SubtitleLabel()
 
         self.form = QWidget()
-        self.form.setStyleSheet("QLabel { font-size: 14px; margin-right: 4px; }")
-        form_layout = QFormLayout(self.form)
+        # 标签与输入框共用一个网格，按列统一计算尺寸
+        form_layout = QGridLayout(self.form)
+        form_layout.setColumnStretch(1, 1)
 
         self.name_edit = LineEdit()
         self.account_edit = LineEdit()
         self.password_edit = PasswordLineEdit()
         self.account_name_edit = LineEdit()
 
-        form_layout.addRow(BodyLabel("名称 (可选)"), self.name_edit)
-        form_layout.addRow(BodyLabel("账号"), self.account_edit)
-        form_layout.addRow(BodyLabel("密码"), self.password_edit)
-        form_layout.addRow(BodyLabel("希沃用户名 (可选)"), self.account_name_edit)
+        # BodyLabel 默认即为 14px 字体，直接设置边距，避免为整个表单挂载样式表
+        for row, (text, widget) in enumerate(
+            (
+                ("名称 (可选)", self.name_edit),
+                ("账号", self.account_edit),
+                ("密码", self.password_edit),
+                ("希沃用户名 (可选)", self.account_name_edit),
+            )
+        ):
+            label = BodyLabel(text)
+            label.setContentsMargins(0, 0, 4, 0)
+            form_layout.addWidget(label, row, 0)
+            form_layout.addWidget(widget, row, 1)
 
         self.save_button = PrimaryPushButton("保存")
         self.save_button.clicked.connect(self._handle_save_automation)
@@ -359,7 +401,14 @@ class ProfileManagePage(QWidget):
         layout.addLayout(main_layout, 1)
 
         self._init_selector()
+
+        # 合并同一轮事件循环内的多次档案变更，只同步一次绑定
+        self._model_sync_timer = QTimer(self)
+        self._model_sync_timer.setSingleShot(True)
+        self._model_sync_timer.setInterval(0)
+        self._model_sync_timer.timeout.connect(self._flush_profile_changes)
         profile.notifier.changed.connect(self._on_profile_model_changed)
+        self._avatar_thread: AvatarRefreshThread | None = None
         self._refresh_qrcode_avatars()
 
     def showEvent(self, event):
@@ -367,29 +416,40 @@ class ProfileManagePage(QWidget):
         self._refresh_qrcode_avatars()
 
     def _refresh_qrcode_avatars(self):
-        """比对缓存头像与网络头像，仅更新有变化的"""
-        changed = False
+        """在后台补全缺失的二维码登录头像缓存"""
+        if self._avatar_thread is not None:
+            return
+
+        targets: list[tuple[str, str, str]] = []
         for auto in profile.list_automation():
             if not isinstance(auto, QrCodeAutomation) or not auto.token or not auto.user_id:
                 continue
-
-            avatar_url = fetch_qrcode_avatar(auto.token)
-            if not avatar_url:
+            # 本地缓存仍然有效时无需请求网络
+            if auto.avatar and Path(str(auto.avatar)).exists():
                 continue
+            targets.append((auto.id, auto.token, auto.user_id))
 
-            cached = str(auto.avatar) if auto.avatar else ""
-            if cached:
-                cache_path = Path(cached)
-                if not cache_path.exists():
-                    new_path = self._cache_qrcode_avatar(auto.user_id, avatar_url)
-                    if new_path and new_path != cached:
-                        auto.avatar = new_path
-                        changed = True
-            else:
-                new_path = self._cache_qrcode_avatar(auto.user_id, avatar_url)
-                if new_path:
-                    auto.avatar = new_path
-                    changed = True
+        if not targets:
+            return
+
+        thread = AvatarRefreshThread(targets)
+        thread.refreshed.connect(self._on_qrcode_avatars_refreshed)
+        thread.finished.connect(self._on_avatar_thread_finished)
+        # 页面销毁后不再回调页面，并让线程尽早结束
+        self.destroyed.connect(thread.requestInterruption)
+        self._avatar_thread = thread
+        thread.start()
+
+    def _on_avatar_thread_finished(self):
+        self._avatar_thread = None
+
+    def _on_qrcode_avatars_refreshed(self, updates: dict[str, str]):
+        changed = False
+        for automation_id, new_path in updates.items():
+            auto = profile.get_automation(automation_id)
+            if auto is not None and str(auto.avatar or "") != new_path:
+                auto.avatar = new_path
+                changed = True
 
         if changed:
             profile.save(reason="automation_saved")
@@ -408,24 +468,22 @@ class ProfileManagePage(QWidget):
             content = "；".join(errors[:3]) if errors else "请检查 ClassIsland 状态与配置"
             if len(errors) > 3:
                 content += "；..."
-            InfoBar.error(
-                title="同步自动化失败",
-                content=content,
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=5000,
-                parent=get_main_container(),
-            )
+            show_info_bar("error", "同步自动化失败", content, duration=5000)
 
     def _init_selector(self):
         self.current_list_item = None
-        self.auto_list.clear()
         self._clear_editor()
 
-        for automation in profile.list_automation():
-            self._add_automation_item(automation)
-        self.refresh_binding_display()
+        # 暂停重绘，整个列表填充完成后统一布局
+        self.auto_list.setUpdatesEnabled(False)
+        try:
+            self.auto_list.clear()
+            self._items.clear()
+            for automation in profile.list_automation():
+                self._add_automation_item(automation)
+            self.refresh_binding_display()
+        finally:
+            self.auto_list.setUpdatesEnabled(True)
 
     def _add_automation_item(self, automation: BaseAutomation):
         item = QListWidgetItem(self.auto_list)
@@ -440,6 +498,7 @@ class ProfileManagePage(QWidget):
         self.auto_list.setItemWidget(item, item_widget)
         item.setSizeHint(item_widget.sizeHint())
         item.setData(Qt.ItemDataRole.UserRole, automation)
+        self._items[automation.id] = item
         return item
 
     def _add_automation(self):
@@ -460,8 +519,6 @@ class ProfileManagePage(QWidget):
     @staticmethod
     def _cache_qrcode_avatar(user_id: str, avatar_url: str) -> str | None:
         """下载头像到本地缓存，返回缓存路径"""
-        from EasiAuto.consts import CACHE_DIR
-
         cache_dir = CACHE_DIR / "avatars"
         cache_dir.mkdir(parents=True, exist_ok=True)
         cache_file = cache_dir / f"{user_id}.png"
@@ -471,8 +528,6 @@ class ProfileManagePage(QWidget):
             return str(cache_file)
 
         try:
-            import requests
-
             resp = requests.get(avatar_url, timeout=1)
             if resp.status_code == 200:
                 cache_file.write_bytes(resp.content)
@@ -532,15 +587,7 @@ class ProfileManagePage(QWidget):
 
         info = fetch_current_login_info(True)
         if not info or info.get("statusCode") != 202:
-            InfoBar.warning(
-                title="导入失败",
-                content="未登录希沃白板或管道不可用",
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=3000,
-                parent=get_main_container(),
-            )
+            show_info_bar("warning", "导入失败", "未登录希沃白板或管道不可用")
             return
 
         token = info.get("token", "")
@@ -549,15 +596,7 @@ class ProfileManagePage(QWidget):
         phone = info.get("phone", "")
 
         if not token or not user_id:
-            InfoBar.warning(
-                title="导入失败",
-                content="获取到的登录信息不完整",
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=3000,
-                parent=get_main_container(),
-            )
+            show_info_bar("warning", "导入失败", "获取到的登录信息不完整")
             return
 
         avatar_path = None
@@ -589,15 +628,7 @@ class ProfileManagePage(QWidget):
         profile.save(reason="automation_saved")
         self._init_selector()
         self.profileChanged.emit()
-        InfoBar.success(
-            title="导入成功",
-            content=f"已导入账户 {nick_name}",
-            orient=Qt.Orientation.Horizontal,
-            isClosable=True,
-            position=InfoBarPosition.TOP,
-            duration=3000,
-            parent=get_main_container(),
-        )
+        show_info_bar("success", "导入成功", f"已导入账户 {nick_name}")
 
     def _display_name(self, automation: BaseAutomation) -> str:
         return automation.name or "未命名档案"
@@ -668,6 +699,10 @@ class ProfileManagePage(QWidget):
             self.current_automation.password = password
             self.current_automation.account_name = self.account_name_edit.text().strip() or None
 
+        # 表单内容未变化时无需替换档案并重新序列化写盘
+        if profile.get_automation(self.current_automation.id) == self.current_automation:
+            return
+
         profile.upsert_automation(self.current_automation)
         profile.save(reason="automation_saved")
 
@@ -675,40 +710,20 @@ class ProfileManagePage(QWidget):
         try:
             self._save_form()
         except ValueError as e:
-            InfoBar.error(
-                title="保存失败",
-                content=str(e),
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2500,
-                parent=get_main_container(),
-            )
+            show_info_bar("error", "保存失败", str(e), duration=2500)
             return
         except Exception as e:
             logger.exception("保存档案时发生异常")
-            InfoBar.error(
-                title="保存失败",
-                content=f"发生未知错误: {e}",
-                orient=Qt.Orientation.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=3000,
-                parent=get_main_container(),
-            )
+            show_info_bar("error", "保存失败", f"发生未知错误: {e}")
             return
 
         self.is_new_automation = False
         self._init_selector()
 
-        for i in range(self.auto_list.count()):
-            item = self.auto_list.item(i)
-            automation = item.data(Qt.ItemDataRole.UserRole)
-            if self.current_automation and automation.id == self.current_automation.id:
-                self.auto_list.setCurrentItem(item)
-                self.current_list_item = item
-                self._update_editor(automation)
-                break
+        if self.current_automation and (item := self._items.get(self.current_automation.id)):
+            self.auto_list.setCurrentItem(item)
+            self.current_list_item = item
+            self._update_editor(item.data(Qt.ItemDataRole.UserRole).model_copy(deep=True))
 
         self.profileChanged.emit()
 
@@ -756,21 +771,13 @@ class ProfileManagePage(QWidget):
                 self.current_list_item = None
                 self.current_automation = None
                 self._clear_editor()
+            self._items.pop(automation.id, None)
             self.auto_list.takeItem(self.auto_list.row(item))
             self.profileChanged.emit()
 
     def scroll_to_automation(self, automation_id: str):
         """跳转并选中指定的自动化档案"""
-        target_item = None
-
-        for i in range(self.auto_list.count()):
-            item = self.auto_list.item(i)
-            automation: EasiAutomation = item.data(Qt.ItemDataRole.UserRole)
-            if automation and automation.id == automation_id:
-                target_item = item
-                break
-
-        if target_item:
+        if target_item := self._items.get(automation_id):
             self.auto_list.setCurrentItem(target_item)
             self.auto_list.scrollToItem(target_item)
 
@@ -808,8 +815,11 @@ class ProfileManagePage(QWidget):
 
     def _on_profile_model_changed(self, reason: ProfileChangeReason):
         if reason in {"automation_saved", "automation_deleted"}:
-            self._sync_bindings()
-            self.refresh_binding_display()
+            self._model_sync_timer.start()
+
+    def _flush_profile_changes(self):
+        self._sync_bindings()
+        self.refresh_binding_display()
 
 
 class ProfilePage(QWidget):
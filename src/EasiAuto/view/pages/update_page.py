@@ -11,7 +11,6 @@ from loguru import logger
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QHBoxLayout,
-    QScroller,
     QStackedWidget,
     QVBoxLayout,
     QWidget,
@@ -44,7 +43,7 @@ from EasiAuto.models.config import DownloadSource, UpdateMode, config
 from EasiAuto.services.toast_service import ToastNotifier
 from EasiAuto.services.update_service import ChangeLog, UpdateDecision, update_checker
 from EasiAuto.view.components import SettingCard
-from EasiAuto.view.helpers import get_app, get_main_container, get_main_window, set_tooltip
+from EasiAuto.view.helpers import enable_drag_scroll, get_app, get_main_container, get_main_window, set_tooltip
 
 
 class HighlightedChangeLogCard(CardWidget):
@@ -122,7 +121,7 @@ class UpdateContentView(QWidget):
         scroll_area = SmoothScrollArea(self)
         scroll_area.setWidgetResizable(True)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        QScroller.grabGesture(scroll_area.viewport(), QScroller.ScrollerGestureType.LeftMouseButtonGesture)
+        enable_drag_scroll(scroll_area)
         scroll_area.setWidget(container)
 
         return scroll_area
@@ -172,7 +171,7 @@ class UpdateContentView(QWidget):
         scroll_area = SmoothScrollArea(self)
         scroll_area.setWidgetResizable(True)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        QScroller.grabGesture(scroll_area.viewport(), QScroller.ScrollerGestureType.LeftMouseButtonGesture)
+        enable_drag_scroll(scroll_area)
         scroll_area.setWidget(container)
 
         return scroll_area